@@ -8,7 +8,11 @@ the scraped book data with advanced analytics.
 @author Jeffrey Dabo
 @date 2025
 """
+import io
+import os
+import atexit
 import sys
+import json
 from pathlib import Path
 
 # Add project root to Python path
@@ -19,14 +23,42 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+from pyarrow import csv as pa_csv
+from datetime import datetime
 from loguru import logger
 
 from src.database.connection import db_manager
-from src.scraper.books_scraper import BooksScraper
+from src.utils.config import get_config
 
+# On-disk copy of the cleaned data, shared by every session and worker
+_CACHE_PATH = get_config().data_dir / "books.feather"
+_CACHE_META_PATH = get_config().data_dir / "books.meta.json"
+# Bump whenever load_data changes the layout of the cleaned frame
+_CACHE_VERSION = 8
+
+# Book columns the dashboard reads; descriptions, image URLs and the
+# bookkeeping timestamps are never fetched
+_USED_COLUMNS = [
+    'title', 'price', 'availability', 'rating', 'category', 'url', 'upc',
+    'price_excl_tax', 'price_incl_tax', 'tax', 'scraped_at'
+]
+
+# Price bands used for the price range breakdown
+_PRICE_EDGES = np.array([0, 20, 40, 60, 80, 100], dtype=np.float64)
+_PRICE_LABELS = ['£0-20', '£20-40', '£40-60', '£60-80', '£80+']
+
+# First number in the availability text, wherever it sits relative to the status
+_STOCK_QUANTITY_PATTERN = r'(?P<quantity>\d+)'
+
+# Text columns stay Arrow-backed in pandas instead of becoming Python objects
+_ARROW_STRING_TYPES = {pa.string(): pd.StringDtype('pyarrow')}.get
+
+# Most books drawn individually by a per-book chart; larger sets are sampled
+_RENDER_LIMIT = 5000
 
 # Page configuration
 st.set_page_config(
@@ -55,6 +87,16 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def setup_directories():
+    """
+    Create the data and logs directories once per server process.
+
+    @returns {None}
+    """
+    get_config().setup_directories()
+
+
 def init_database():
     """
     Initialize database connection.
@@ -68,44 +110,395 @@ def init_database():
         st.error(f"Database initialization failed: {e}")
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+def _read_cached_frame(signature):
+    """
+    Read the cleaned data from disk if it still matches the database.
+
+    @param {list} signature - Row count and latest scrape time of the books table
+    @returns {DataFrame|None} Cached DataFrame or None on a cache miss
+    """
+    try:
+        meta = json.loads(_CACHE_META_PATH.read_text())
+        if meta != {'version': _CACHE_VERSION, 'signature': signature}:
+            return None
+        return feather.read_table(_CACHE_PATH, memory_map=True).to_pandas(types_mapper=_ARROW_STRING_TYPES)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_frame(df, signature):
+    """
+    Persist the cleaned data to disk along with its database signature.
+
+    @param {DataFrame} df - Cleaned book data
+    @param {list} signature - Row count and latest scrape time of the books table
+    @returns {None}
+    """
+    tmp_path = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        # Replace atomically so readers never map a half-written file
+        feather.write_feather(df, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, _CACHE_PATH)
+        _CACHE_META_PATH.write_text(json.dumps({'version': _CACHE_VERSION, 'signature': signature}))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not write data cache: {e}")
+
+
+def _parse_availability(availability):
+    """
+    Derive the stock flag and quantity from availability texts.
+
+    The status and the number are matched independently, so texts such as
+    "22 available / In stock" keep their quantity.
+
+    @param {ChunkedArray} availability - Availability texts
+    @returns {tuple} Boolean in_stock and float32 stock_quantity arrays
+    """
+    in_stock = pc.fill_null(pc.match_substring(availability, 'in stock', ignore_case=True), False)
+    stock_quantity = pc.cast(
+        pc.struct_field(pc.extract_regex(availability, _STOCK_QUANTITY_PATTERN), [0]),
+        'float32'
+    )
+    return in_stock, stock_quantity
+
+
+def _truncate_titles(titles, width):
+    """
+    Cut titles to a fixed width and mark them with an ellipsis.
+
+    @param {Array|ChunkedArray|Series} titles - Book titles
+    @param {int} width - Number of characters to keep
+    @returns {ChunkedArray|Array} Truncated titles
+    """
+    if isinstance(titles, pd.Series):
+        titles = pa.array(titles, type=pa.string())
+    return pc.binary_join_element_wise(
+        pc.utf8_slice_codeunits(titles, 0, width), '...', ''
+    )
+
+
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def load_data():
     """
     Load data from database with caching.
 
+    The cleaned frame is also kept on disk and only rebuilt when the
+    row count or latest scrape time of the books table changes. The
+    same frame is shared by every session without being copied, so
+    callers must treat it as read-only.
+
     @returns {DataFrame} Pandas DataFrame with book data
     """
     try:
-        books = db_manager.get_all_books()
-        if not books:
+        signature = db_manager.get_books_signature()
+        if signature[0] == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(books)
+        cached = _read_cached_frame(signature)
+        if cached is not None:
+            return cached
 
-        # Data type conversions and cleaning
-        if 'scraped_at' in df.columns:
-            df['scraped_at'] = pd.to_datetime(df['scraped_at'])
-        if 'created_at' in df.columns:
-            df['created_at'] = pd.to_datetime(df['created_at'])
+        table = db_manager.get_books_table(_USED_COLUMNS)
+        if table.num_rows == 0:
+            return pd.DataFrame()
 
-        # Extract stock quantity from availability
-        df['stock_quantity'] = df['availability'].str.extract(r'(\d+)').astype(float)
-        df['in_stock'] = df['availability'].str.contains('In stock', case=False, na=False)
+        # Cleaning runs as Arrow compute kernels before a single pandas conversion
+        in_stock, stock_quantity = _parse_availability(table['availability'])
+
+        # Categories are dictionary-encoded against their sorted distinct values,
+        # so pandas receives a categorical column without another pass
+        category = pc.fill_null(table['category'], 'Unknown').combine_chunks()
+        distinct = pc.unique(category)
+        distinct = pc.take(distinct, pc.sort_indices(distinct))
+        category = pa.DictionaryArray.from_arrays(pc.index_in(category, value_set=distinct), distinct)
+
+        # Add price bins for analysis; the outer bands absorb out-of-range prices
+        codes = np.digitize(table['price'].to_numpy(), _PRICE_EDGES, right=True) - 1
+        price_range = pa.DictionaryArray.from_arrays(
+            pa.array(np.clip(codes, 0, len(_PRICE_LABELS) - 1).astype(np.int8)),
+            pa.array(_PRICE_LABELS),
+            ordered=True
+        )
 
-        # Clean category
-        df['category'] = df['category'].fillna('Unknown')
+        table = table.set_column(table.schema.get_field_index('category'), 'category', category)
+        # Availability texts repeat heavily, so they are stored as a categorical too
+        table = table.set_column(
+            table.schema.get_field_index('availability'),
+            'availability',
+            pc.dictionary_encode(table['availability'])
+        )
+        table = table.set_column(
+            table.schema.get_field_index('rating'),
+            'rating',
+            pc.cast(pc.fill_null(table['rating'], 0), pa.int8())
+        )
+        table = table.append_column('stock_quantity', stock_quantity)
+        table = table.append_column('in_stock', in_stock)
+        table = table.append_column('title_short', _truncate_titles(table['title'], 50))
+        table = table.append_column('price_range', price_range)
 
-        # Add price bins for analysis
-        df['price_range'] = pd.cut(df['price'],
-                                   bins=[0, 20, 40, 60, 80, 100],
-                                   labels=['£0-20', '£20-40', '£40-60', '£60-80', '£80+'])
+        df = table.to_pandas(types_mapper=_ARROW_STRING_TYPES)
 
+        _write_cached_frame(df, signature)
         return df
     except Exception as e:
         st.error(f"Failed to load data: {e}")
         return pd.DataFrame()
 
 
+def _lttb_indices(x, y, n_out):
+    """
+    Pick representative points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between
+    keeps the point forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+
+    @param {ndarray} x - X values sorted in ascending order
+    @param {ndarray} y - Y values aligned with x
+    @param {int} n_out - Number of points to keep
+    @returns {ndarray} Indices of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+
+    return kept
+
+
+def _render_sample(n):
+    """
+    Pick the rows a per-book chart draws, sampling uniformly above _RENDER_LIMIT.
+
+    @param {int} n - Number of books available
+    @returns {ndarray} Sorted row positions to plot
+    """
+    if n <= _RENDER_LIMIT:
+        return np.arange(n)
+    return np.sort(np.random.default_rng(0).choice(n, _RENDER_LIMIT, replace=False))
+
+
+def _annotate_sample(fig, shown, total):
+    """
+    Note on a figure that it only draws a sample of the books.
+
+    @param {Figure} fig - Plotly figure to annotate
+    @param {int} shown - Number of books drawn
+    @param {int} total - Number of books available
+    @returns {Figure} The same figure
+    """
+    if shown < total:
+        fig.add_annotation(
+            text=f"Sampled {shown:,} of {total:,} books",
+            xref='paper', yref='paper', x=1, y=1.05,
+            xanchor='right', showarrow=False, font=dict(size=11, color='gray')
+        )
+    return fig
+
+
+def _top_k_indices(values, k):
+    """
+    Find the positions of the k largest values without sorting them all.
+
+    @param {ndarray} values - Scores to rank
+    @param {int} k - Number of positions to return
+    @returns {ndarray} Positions ordered from largest to smallest value
+    """
+    k = min(k, len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+
+    top = np.argpartition(values, len(values) - k)[len(values) - k:]
+    return top[np.lexsort((top, -values[top]))]
+
+
+def _correlation_matrix(matrix):
+    """
+    Pearson correlation over pairwise-complete rows, like DataFrame.corr().
+
+    Each column is centred and the pairwise sums are taken with float32
+    matrix products instead of a per-pair Python loop.
+
+    @param {ndarray} matrix - Observations in rows, variables in columns
+    @returns {ndarray} Square correlation matrix
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    valid = ~np.isnan(matrix)
+
+    if valid.all():
+        # Fully populated: standardise the block and take a single product
+        standardised = matrix - matrix.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            standardised /= np.sqrt((standardised * standardised).sum(axis=0))
+        return np.clip(standardised.T @ standardised, -1, 1)
+
+    centred = np.where(valid, matrix - np.nanmean(matrix, axis=0), 0).astype(np.float32)
+    weights = valid.astype(np.float32)
+
+    n = weights.T @ weights
+    sums = centred.T @ weights
+    squares = (centred * centred).T @ weights
+    products = centred.T @ centred
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = products - sums * sums.T / n
+        var = squares - sums * sums / n
+        corr = cov / np.sqrt(var * var.T)
+    return np.clip(corr, -1, 1)
+
+
+def overview_stats(df):
+    """
+    Compute the headline metrics straight from the column arrays.
+
+    @param {DataFrame} df - Book data
+    @returns {dict} Book count, average price and rating, in-stock and category counts
+    """
+    return {
+        'total_books': len(df),
+        'avg_price': float(df['price'].to_numpy().mean()),
+        'avg_rating': float(df['rating'].to_numpy().mean()),
+        'in_stock': int(np.count_nonzero(df['in_stock'].to_numpy())),
+        # Categories are built from the observed values, so this is nunique in O(1)
+        'categories': len(df['category'].cat.categories),
+    }
+
+
+def data_etag(df):
+    """
+    Identify the loaded data cheaply so cached results can be keyed on it.
+
+    Cached helpers take the frame as an unhashed argument plus this tag,
+    which avoids hashing every column on each rerun.
+
+    @param {DataFrame} df - Book data
+    @returns {tuple} Row count and latest scrape time in nanoseconds
+    """
+    if 'scraped_at' not in df.columns or df.empty:
+        return (len(df), 0)
+    return (len(df), int(df['scraped_at'].max().value))
+
+
+@st.cache_data(ttl=300)
+def category_summary(etag):
+    """
+    Get per-category statistics aggregated by the database.
+
+    @param {tuple} etag - Data version from data_etag
+    @returns {DataFrame} Per-category statistics sorted by book count
+    """
+    return pd.DataFrame(
+        db_manager.get_category_statistics(),
+        columns=['category', 'count', 'avg_price', 'min_price', 'max_price', 'avg_rating', 'in_stock']
+    ).set_index('category')
+
+
+@st.cache_data(ttl=300)
+def rating_summary(etag):
+    """
+    Get book counts and average prices per rating aggregated by the database.
+
+    @param {tuple} etag - Data version from data_etag
+    @returns {DataFrame} Per-rating count and average price in rating order
+    """
+    return pd.DataFrame(
+        db_manager.get_rating_statistics(),
+        columns=['rating', 'count', 'avg_price']
+    ).set_index('rating')
+
+
+@st.cache_data(ttl=300)
+def precompute_summaries(_df, etag):
+    """
+    Compute the small summaries the dashboard sections share, once per data version.
+
+    @param {DataFrame} _df - Book data
+    @param {tuple} etag - Data version from data_etag
+    @returns {dict} Data version, headline metrics, category, rating and
+        price range summaries, the correlation matrix (or None), the row
+        positions of the top-K tables and the books scraped per day (or None)
+    """
+    numeric_cols = ['price', 'rating', 'price_excl_tax', 'price_incl_tax', 'tax']
+    available_cols = [col for col in numeric_cols if col in _df.columns and _df[col].notna().any()]
+    correlation = None
+    if len(available_cols) >= 2:
+        correlation = pd.DataFrame(
+            _correlation_matrix(_df[available_cols].to_numpy(dtype=np.float32, na_value=np.nan)),
+            index=available_cols,
+            columns=available_cols
+        )
+
+    # Top-K rankings as row positions, selected with argpartition
+    prices = _df['price'].to_numpy()
+    ratings = _df['rating'].to_numpy()
+    five_star = np.flatnonzero(ratings == 5)
+    value_score = ratings / (prices + 1)  # +1 to avoid division by zero
+    best_value = _top_k_indices(value_score, 15)
+
+    # Books per day with np.bincount over day ordinals
+    daily_counts = None
+    if 'scraped_at' in _df.columns and _df['scraped_at'].notna().any():
+        days = _df['scraped_at'].dropna().to_numpy().astype('datetime64[D]').view('int64')
+        first_day = days.min()
+        counts = np.bincount(days - first_day)
+        daily_counts = pd.DataFrame({
+            'scrape_date': np.arange(first_day, first_day + len(counts)).astype('datetime64[D]'),
+            'count': counts,
+            'cumulative': counts.cumsum()
+        })
+
+    price_ranges = _df['price_range'].cat
+    return {
+        'etag': etag,
+        'overview': overview_stats(_df),
+        'categories': category_summary(etag),
+        'ratings': rating_summary(etag),
+        'price_ranges': pd.Series(
+            np.bincount(price_ranges.codes.to_numpy(), minlength=len(price_ranges.categories)),
+            index=price_ranges.categories
+        ),
+        'correlation': correlation,
+        'top_expensive': _top_k_indices(prices, 10),
+        'top_rated': five_star[_top_k_indices(prices[five_star], 10)],
+        'best_value': best_value,
+        'best_value_score': value_score[best_value],
+        'daily_counts': daily_counts,
+    }
+
+
+@st.cache_resource
+def get_scraper():
+    """
+    Get the shared scraper so its HTTP session and connection pool are reused.
+
+    @returns {BooksScraper} Scraper instance
+    """
+    # Imported here so dashboard views never load requests and BeautifulSoup
+    from src.scraper.books_scraper import BooksScraper
+
+    scraper = BooksScraper()
+    atexit.register(scraper.close)
+    return scraper
+
+
 def scrape_data(max_pages=None, by_category=False):
     """
     Trigger scraping process.
@@ -116,14 +509,13 @@ def scrape_data(max_pages=None, by_category=False):
     """
     try:
         with st.spinner("Scraping data... This may take a while."):
-            scraper = BooksScraper()
-            books = scraper.scrape(max_pages=max_pages, by_category=by_category)
-            scraper.close()
+            books = get_scraper().scrape(max_pages=max_pages, by_category=by_category)
 
             if books:
                 inserted = db_manager.insert_books_bulk(books)
                 st.success(f"Scraped {len(books)} books, inserted {inserted} new records")
-                st.cache_data.clear()  # Clear cache to reload data
+                load_data.clear()  # Clear cache to reload data
+                st.cache_data.clear()
                 return len(books)
             else:
                 st.warning("No books were scraped")
@@ -133,11 +525,474 @@ def scrape_data(max_pages=None, by_category=False):
         return 0
 
 
-def show_price_analysis(df):
+def _histogram_bar(values, bins, color):
+    """
+    Bin values with numpy and draw the counts as a bar trace.
+
+    Only the bin counts reach the browser instead of every raw value.
+
+    @param {ndarray} values - Values to bin
+    @param {int} bins - Number of equal-width bins
+    @param {str} color - Bar color
+    @returns {Figure} Plotly figure with one bar per bin
+    """
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=0.5 * (edges[:-1] + edges[1:]),
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+    fig.update_layout(bargap=0)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_price_histogram(_prices, etag):
+    """
+    Build the price distribution histogram.
+
+    @param {ndarray} _prices - Book prices
+    @param {tuple} etag - Data version the prices belong to
+    @returns {Figure} Plotly figure
+    """
+    fig = _histogram_bar(_prices, 50, '#1f77b4')
+    fig.update_layout(
+        title='Price Distribution',
+        xaxis_title='Price (£)',
+        yaxis_title='Number of Books'
+    )
+    mean_price, median_price = _prices.mean(), np.median(_prices)
+    fig.add_vline(x=mean_price, line_dash="dash", line_color="red",
+                  annotation_text=f"Mean: £{mean_price:.2f}")
+    fig.add_vline(x=median_price, line_dash="dash", line_color="green",
+                  annotation_text=f"Median: £{median_price:.2f}")
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_price_range_bar(price_range_counts):
+    """
+    Build the books-per-price-range bar chart.
+
+    @param {Series} price_range_counts - Book count per price range
+    @returns {Figure} Plotly figure
+    """
+    return px.bar(
+        x=price_range_counts.index,
+        y=price_range_counts.values,
+        title='Books by Price Range',
+        labels={'x': 'Price Range', 'y': 'Number of Books'},
+        color=price_range_counts.values,
+        color_continuous_scale='Blues'
+    )
+
+
+@st.cache_resource(max_entries=32)
+def _fig_price_by_rating_box(_ratings, _prices, etag):
+    """
+    Build the price-by-rating box plot.
+
+    @param {ndarray} _ratings - Book ratings
+    @param {ndarray} _prices - Book prices aligned with ratings
+    @param {tuple} etag - Data version the arrays belong to
+    @returns {Figure} Plotly figure
+    """
+    keep = _render_sample(len(_prices))
+    fig = px.box(
+        pd.DataFrame({'rating': _ratings[keep], 'price': _prices[keep]}),
+        x='rating',
+        y='price',
+        title='Price Distribution by Rating',
+        labels={'rating': 'Rating', 'price': 'Price (£)'},
+        color='rating',  # Use discrete color
+        color_discrete_sequence=px.colors.sequential.Viridis
+    )
+    return _annotate_sample(fig, len(keep), len(_prices))
+
+
+@st.cache_resource(max_entries=32)
+def _fig_category_price_bar(category_stats):
+    """
+    Build the average-price-by-category bar chart.
+
+    @param {DataFrame} category_stats - Per-category statistics indexed by category
+    @returns {Figure} Plotly figure
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Average',
+        x=category_stats.index,
+        y=category_stats['avg_price'],
+        marker_color='lightblue'
+    ))
+    fig.update_layout(
+        title='Average Price by Category (Top 10)',
+        xaxis_title='Category',
+        yaxis_title='Price (£)',
+        xaxis_tickangle=-45,
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_rating_bar(rating_counts):
+    """
+    Build the rating distribution bar chart.
+
+    @param {Series} rating_counts - Book count per rating
+    @returns {Figure} Plotly figure
+    """
+    fig = px.bar(
+        x=rating_counts.index,
+        y=rating_counts.values,
+        title='Rating Distribution',
+        labels={'x': 'Rating', 'y': 'Number of Books'},
+        text=rating_counts.values,
+        color=rating_counts.values,
+        color_continuous_scale='YlOrRd'
+    )
+    fig.update_traces(textposition='outside')
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_rating_pie(rating_counts):
+    """
+    Build the rating share pie chart.
+
+    @param {Series} rating_counts - Book count per rating
+    @returns {Figure} Plotly figure
+    """
+    return px.pie(
+        values=rating_counts.values,
+        names=[f"{i}" for i in rating_counts.index],
+        title='Rating Distribution (%)',
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+
+
+@st.cache_resource(max_entries=32)
+def _fig_price_rating_scatter(_ratings, _prices, etag):
+    """
+    Build the price vs rating scatter from an LTTB sample.
+
+    Only the markers are sampled; the OLS trendline is fitted on every
+    book, since LTTB favours extreme points and would skew the fit.
+
+    @param {ndarray} _ratings - Book ratings
+    @param {ndarray} _prices - Book prices aligned with ratings
+    @param {tuple} etag - Data version the arrays belong to
+    @returns {Figure} Plotly figure
+    """
+    # Downsample along price with LTTB so the sample keeps the distribution's shape
+    order = np.argsort(_prices, kind='stable')
+    keep = order[_lttb_indices(
+        _prices[order].astype(np.float64),
+        _ratings[order].astype(np.float64),
+        500
+    )]
+    fig = px.scatter(
+        pd.DataFrame({'rating': _ratings[keep], 'price': _prices[keep]}),
+        x='rating',
+        y='price',
+        title='Price vs Rating Correlation',
+        labels={'rating': 'Rating', 'price': 'Price (£)'},
+        opacity=0.6,
+        color='price',  # Color by price instead
+        color_continuous_scale='Viridis',
+        render_mode='webgl'
+    )
+
+    ratings = _ratings.astype(np.float64)
+    if len(ratings) > 1 and ratings.min() < ratings.max():
+        slope, intercept = np.polyfit(ratings, _prices.astype(np.float64), 1)
+        line_x = np.array([ratings.min(), ratings.max()])
+        fig.add_trace(go.Scatter(
+            x=line_x,
+            y=slope * line_x + intercept,
+            mode='lines',
+            name='OLS trendline',
+            showlegend=False,
+            hovertemplate=f'price = {slope:.4f} * rating + {intercept:.4f}<extra>OLS trendline</extra>'
+        ))
+    return _annotate_sample(fig, len(keep), len(_prices))
+
+
+@st.cache_resource(max_entries=32)
+def _fig_rating_price_line(rating_price):
+    """
+    Build the average-price-by-rating line chart.
+
+    @param {DataFrame} rating_price - Average price per rating
+    @returns {Figure} Plotly figure
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=rating_price['rating'],
+        y=rating_price['price'],
+        mode='lines+markers',
+        marker=dict(
+            size=12,
+            color=rating_price['price'],
+            colorscale='Viridis',
+            showscale=True
+        ),
+        line=dict(width=3, color='rgba(100, 100, 250, 0.5)')
+    ))
+    fig.update_layout(
+        title='Average Price by Rating',
+        xaxis_title='Rating',
+        yaxis_title='Average Price (£)',
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_category_count_bar(category_counts):
+    """
+    Build the top-15 categories bar chart.
+
+    @param {Series} category_counts - Book count per category
+    @returns {Figure} Plotly figure
+    """
+    fig = px.bar(
+        x=category_counts.values,
+        y=category_counts.index,
+        orientation='h',
+        title='Top 15 Categories by Book Count',
+        labels={'x': 'Number of Books', 'y': 'Category'},
+        color=category_counts.values,
+        color_continuous_scale='Teal',
+        text=category_counts.values
+    )
+    fig.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        height=500
+    )
+    fig.update_traces(textposition='outside')
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_category_pie(category_counts):
+    """
+    Build the top-10 categories pie chart.
+
+    @param {Series} category_counts - Book count per category
+    @returns {Figure} Plotly figure
+    """
+    fig = px.pie(
+        values=category_counts.values,
+        names=category_counts.index,
+        title='Top 10 Categories Distribution',
+        hole=0.4
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_stock_status_pie(in_stock, out_of_stock):
+    """
+    Build the in-stock vs out-of-stock pie chart.
+
+    @param {int} in_stock - Number of books in stock
+    @param {int} out_of_stock - Number of books out of stock
+    @returns {Figure} Plotly figure
+    """
+    slices = [(label, count) for label, count in
+              (('In Stock', in_stock), ('Out of Stock', out_of_stock)) if count]
+    fig = px.pie(
+        values=[count for _, count in slices],
+        names=[label for label, _ in slices],
+        title='Stock Status',
+        color_discrete_sequence=['#2ecc71', '#e74c3c'],
+        hole=0.3
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_stock_quantity_histogram(_quantities, etag):
+    """
+    Build the stock quantity histogram.
+
+    @param {ndarray} _quantities - Known stock quantities
+    @param {tuple} etag - Data version the quantities belong to
+    @returns {Figure} Plotly figure
+    """
+    fig = _histogram_bar(_quantities, 20, '#3498db')
+    fig.update_layout(
+        title='Stock Quantity Distribution',
+        xaxis_title='Stock Quantity',
+        yaxis_title='Number of Books',
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_category_stock_bar(category_stock):
+    """
+    Build the stacked in-stock/out-of-stock bar chart per category.
+
+    @param {DataFrame} category_stock - In-stock and total counts per category
+    @returns {Figure} Plotly figure
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='In Stock',
+        x=category_stock['Category'],
+        y=category_stock['In Stock'],
+        marker_color='lightgreen',
+        text=category_stock['In Stock'],
+        textposition='inside'
+    ))
+    fig.add_trace(go.Bar(
+        name='Out of Stock',
+        x=category_stock['Category'],
+        y=category_stock['Out of Stock'],
+        marker_color='lightcoral',
+        text=category_stock['Out of Stock'],
+        textposition='inside'
+    ))
+    fig.update_layout(
+        barmode='stack',
+        xaxis_title='Category',
+        yaxis_title='Number of Books',
+        xaxis_tickangle=-45,
+        height=500
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_top_categories_bar(top_categories):
+    """
+    Build the Overview tab's top categories bar chart.
+
+    @param {Series} top_categories - Book count per category
+    @returns {Figure} Plotly figure
+    """
+    # A plain graph_objects bar skips plotly express' per-call dataframe building
+    fig = go.Figure(go.Bar(
+        y=top_categories.index,
+        x=top_categories.values,
+        orientation='h',
+        marker=dict(color=top_categories.values, colorscale='Greens', showscale=True)
+    ))
+    fig.update_layout(showlegend=False, xaxis_title='Count', yaxis_title='')
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_avg_price_by_rating_bar(avg_by_rating):
+    """
+    Build the Overview tab's average-price-by-rating bar chart.
+
+    @param {Series} avg_by_rating - Average price per rating
+    @returns {Figure} Plotly figure
+    """
+    fig = px.bar(
+        x=avg_by_rating.index,
+        y=avg_by_rating.values,
+        color=avg_by_rating.values,
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(xaxis_title='Rating', yaxis_title='Avg Price (£)')
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_correlation_heatmap(corr_matrix):
+    """
+    Build the correlation heatmap.
+
+    @param {DataFrame} corr_matrix - Square correlation matrix
+    @returns {Figure} Plotly figure
+    """
+    fig = px.imshow(
+        corr_matrix,
+        text_auto='.2f',
+        title='Correlation Heatmap',
+        color_continuous_scale='RdBu_r',
+        aspect='auto',
+        labels=dict(color="Correlation")
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_best_value_scatter(best_value):
+    """
+    Build the best-value bubble chart.
+
+    @param {DataFrame} best_value - Best value books with their value scores
+    @returns {Figure} Plotly figure
+    """
+    fig = px.scatter(
+        best_value,
+        x='price',
+        y='rating',
+        size='value_score',
+        hover_data=['title', 'category'],
+        title='Best Value Books (Bubble size = Value Score)',
+        labels={'price': 'Price (£)', 'rating': 'Rating'},
+        color='category',
+        size_max=60
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _fig_scrape_count_line(daily_counts):
+    """
+    Build the books-scraped-per-day line chart.
+
+    @param {DataFrame} daily_counts - Books scraped per day
+    @returns {Figure} Plotly figure
+    """
+    return px.line(
+        daily_counts,
+        x='scrape_date',
+        y='count',
+        title='Books Scraped Over Time',
+        labels={'scrape_date': 'Date', 'count': 'Number of Books'},
+        markers=True
+    )
+
+
+@st.cache_resource(max_entries=32)
+def _fig_scrape_cumulative_area(daily_counts):
+    """
+    Build the cumulative books-scraped area chart.
+
+    @param {DataFrame} daily_counts - Books scraped per day with running totals
+    @returns {Figure} Plotly figure
+    """
+    return px.area(
+        daily_counts,
+        x='scrape_date',
+        y='cumulative',
+        title='Cumulative Books Scraped',
+        labels={'scrape_date': 'Date', 'cumulative': 'Total Books'}
+    )
+
+
+def show_price_analysis(df, summaries):
     """
     Show price analysis section.
 
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("Price Analysis")
@@ -146,158 +1001,67 @@ def show_price_analysis(df):
 
     with col1:
         # Price distribution histogram
-        fig = px.histogram(
-            df,
-            x='price',
-            nbins=50,
-            title='Price Distribution',
-            labels={'price': 'Price (£)', 'count': 'Number of Books'},
-            color_discrete_sequence=['#1f77b4']
-        )
-        fig.add_vline(x=df['price'].mean(), line_dash="dash", line_color="red",
-                      annotation_text=f"Mean: £{df['price'].mean():.2f}")
-        fig.add_vline(x=df['price'].median(), line_dash="dash", line_color="green",
-                      annotation_text=f"Median: £{df['price'].median():.2f}")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_price_histogram(df['price'].to_numpy(), summaries['etag']), use_container_width=True)
 
     with col2:
         # Price range breakdown
-        price_range_counts = df['price_range'].value_counts().sort_index()
-        fig = px.bar(
-            x=price_range_counts.index,
-            y=price_range_counts.values,
-            title='Books by Price Range',
-            labels={'x': 'Price Range', 'y': 'Number of Books'},
-            color=price_range_counts.values,
-            color_continuous_scale='Blues'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        price_range_counts = summaries['price_ranges']
+        st.plotly_chart(_fig_price_range_bar(price_range_counts), use_container_width=True)
 
     col3, col4 = st.columns(2)
 
     with col3:
-        # Box plot by rating - FIXED
-        fig = px.box(
-            df,
-            x='rating',
-            y='price',
-            title='Price Distribution by Rating',
-            labels={'rating': 'Rating', 'price': 'Price (£)'},
-            color='rating',  # Use discrete color
-            color_discrete_sequence=px.colors.sequential.Viridis
-        )
+        # Box plot by rating
+        fig = _fig_price_by_rating_box(df['rating'].to_numpy(), df['price'].to_numpy(), summaries['etag'])
         st.plotly_chart(fig, use_container_width=True)
 
     with col4:
         # Price statistics by category (top 10)
-        top_categories = df['category'].value_counts().head(10).index
-        df_top = df[df['category'].isin(top_categories)]
-
-        category_stats = df_top.groupby('category')['price'].agg(['mean', 'min', 'max']).reset_index()
-        category_stats = category_stats.sort_values('mean', ascending=False)
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Average',
-            x=category_stats['category'],
-            y=category_stats['mean'],
-            marker_color='lightblue'
-        ))
-        fig.update_layout(
-            title='Average Price by Category (Top 10)',
-            xaxis_title='Category',
-            yaxis_title='Price (£)',
-            xaxis_tickangle=-45,
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        category_stats = summaries['categories'].head(10).sort_values('avg_price', ascending=False)
+        st.plotly_chart(_fig_category_price_bar(category_stats), use_container_width=True)
 
 
-def show_rating_analysis(df):
+def show_rating_analysis(df, summaries):
     """
     Show rating analysis section.
 
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("Rating Analysis")
 
     col1, col2 = st.columns(2)
+    ratings = summaries['ratings']
+    rating_counts = ratings['count']
 
     with col1:
         # Rating distribution
-        rating_counts = df['rating'].value_counts().sort_index()
-        fig = px.bar(
-            x=rating_counts.index,
-            y=rating_counts.values,
-            title='Rating Distribution',
-            labels={'x': 'Rating', 'y': 'Number of Books'},
-            text=rating_counts.values,
-            color=rating_counts.values,
-            color_continuous_scale='YlOrRd'
-        )
-        fig.update_traces(textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_rating_bar(rating_counts), use_container_width=True)
 
     with col2:
         # Rating percentage
-        fig = px.pie(
-            values=rating_counts.values,
-            names=[f"{i}" for i in rating_counts.index],
-            title='Rating Distribution (%)',
-            hole=0.4,
-            color_discrete_sequence=px.colors.sequential.RdBu
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_rating_pie(rating_counts), use_container_width=True)
 
     col3, col4 = st.columns(2)
 
     with col3:
-        # Scatter: Price vs Rating - FIXED
-        sample_df = df.sample(min(500, len(df)))  # Sample for performance
-        fig = px.scatter(
-            sample_df,
-            x='rating',
-            y='price',
-            title='Price vs Rating Correlation',
-            labels={'rating': 'Rating', 'price': 'Price (£)'},
-            trendline='ols',
-            opacity=0.6,
-            color='price',  # Color by price instead
-            color_continuous_scale='Viridis'
-        )
+        # Scatter: Price vs Rating
+        fig = _fig_price_rating_scatter(df['rating'].to_numpy(), df['price'].to_numpy(), summaries['etag'])
         st.plotly_chart(fig, use_container_width=True)
 
     with col4:
         # Average price by rating
-        rating_price = df.groupby('rating')['price'].mean().reset_index()
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=rating_price['rating'],
-            y=rating_price['price'],
-            mode='lines+markers',
-            marker=dict(
-                size=12,
-                color=rating_price['price'],
-                colorscale='Viridis',
-                showscale=True
-            ),
-            line=dict(width=3, color='rgba(100, 100, 250, 0.5)')
-        ))
-        fig.update_layout(
-            title='Average Price by Rating',
-            xaxis_title='Rating',
-            yaxis_title='Average Price (£)',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        rating_price = ratings['avg_price'].rename('price').reset_index()
+        st.plotly_chart(_fig_rating_price_line(rating_price), use_container_width=True)
 
 
-def show_advanced_analytics(df):
+def show_advanced_analytics(df, summaries):
     """
     Show advanced analytics and correlations.
 
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("🔬 Advanced Analytics")
@@ -305,30 +1069,19 @@ def show_advanced_analytics(df):
     # Correlation analysis
     st.markdown("#### Price Correlation Analysis")
 
-    numeric_cols = ['price', 'rating', 'price_excl_tax', 'price_incl_tax', 'tax']
-    available_cols = [col for col in numeric_cols if col in df.columns and df[col].notna().any()]
+    corr_matrix = summaries['correlation']
 
-    if len(available_cols) >= 2:
-        corr_matrix = df[available_cols].corr()
-
-        fig = px.imshow(
-            corr_matrix,
-            text_auto='.2f',
-            title='Correlation Heatmap',
-            color_continuous_scale='RdBu_r',
-            aspect='auto',
-            labels=dict(color="Correlation")
-        )
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+    if corr_matrix is not None:
+        st.plotly_chart(_fig_correlation_heatmap(corr_matrix), use_container_width=True)
 
+    # Rows come from the precomputed rankings; only the displayed columns are gathered
+    top_cols = df.columns.get_indexer(['title_short', 'price', 'category', 'rating'])
     col1, col2 = st.columns(2)
 
     with col1:
         # Top 10 most expensive books
         st.markdown("#### Top 10 Most Expensive Books")
-        top_expensive = df.nlargest(10, 'price')[['title', 'price', 'category', 'rating']].copy()
-        top_expensive['title'] = top_expensive['title'].str[:50] + '...'
+        top_expensive = df.iloc[summaries['top_expensive'], top_cols].rename(columns={'title_short': 'title'})
         st.dataframe(
             top_expensive.style.background_gradient(subset=['price'], cmap='Reds'),
             use_container_width=True,
@@ -338,9 +1091,8 @@ def show_advanced_analytics(df):
     with col2:
         # Top 10 highest rated books
         st.markdown("#### Top Rated Books (5 Stars)")
-        top_rated = df[df['rating'] == 5].nlargest(10, 'price')[['title', 'price', 'category', 'rating']].copy()
+        top_rated = df.iloc[summaries['top_rated'], top_cols].rename(columns={'title_short': 'title'})
         if not top_rated.empty:
-            top_rated['title'] = top_rated['title'].str[:50] + '...'
             st.dataframe(
                 top_rated.style.background_gradient(subset=['price'], cmap='Greens'),
                 use_container_width=True,
@@ -351,30 +1103,20 @@ def show_advanced_analytics(df):
 
     # Value for money analysis
     st.markdown("#### Best Value Books (High Rating, Low Price)")
-    df['value_score'] = df['rating'] / (df['price'] + 1)  # +1 to avoid division by zero
-    best_value = df.nlargest(15, 'value_score')[['title', 'price', 'rating', 'category', 'value_score']].copy()
+    best_value = df.iloc[
+        summaries['best_value'], df.columns.get_indexer(['title', 'price', 'rating', 'category'])
+    ].assign(value_score=summaries['best_value_score'])
 
-    # Truncate long titles
-    best_value['title_short'] = best_value['title'].str[:30] + '...'
+    # Plain labels so Plotly only draws traces for categories present here
+    best_value['category'] = best_value['category'].astype(str)
 
-    fig = px.scatter(
-        best_value,
-        x='price',
-        y='rating',
-        size='value_score',
-        hover_data=['title', 'category'],
-        title='Best Value Books (Bubble size = Value Score)',
-        labels={'price': 'Price (£)', 'rating': 'Rating'},
-        color='category',
-        size_max=60
-    )
-    fig.update_layout(height=500)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_fig_best_value_scatter(best_value), use_container_width=True)
 
     # Show table
     display_cols = ['title', 'price', 'rating', 'category', 'value_score']
-    best_value_display = best_value[display_cols].copy()
-    best_value_display['title'] = best_value_display['title'].str[:60] + '...'
+    best_value_display = best_value.loc[:, display_cols].assign(
+        title=_truncate_titles(best_value['title'], 60).to_pylist()
+    )
     st.dataframe(
         best_value_display.style.background_gradient(subset=['value_score'], cmap='Greens'),
         use_container_width=True,
@@ -382,61 +1124,36 @@ def show_advanced_analytics(df):
     )
 
 
-def show_category_analysis(df):
+def show_category_analysis(df, summaries):
     """
     Show category analysis section.
 
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("Category Analysis")
 
+    summary = summaries['categories']
     col1, col2 = st.columns(2)
 
     with col1:
         # Category distribution
-        category_counts = df['category'].value_counts().head(15)
-        fig = px.bar(
-            x=category_counts.values,
-            y=category_counts.index,
-            orientation='h',
-            title='Top 15 Categories by Book Count',
-            labels={'x': 'Number of Books', 'y': 'Category'},
-            color=category_counts.values,
-            color_continuous_scale='Teal',
-            text=category_counts.values
-        )
-        fig.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            height=500
-        )
-        fig.update_traces(textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
+        category_counts = summary['count'].head(15)
+        st.plotly_chart(_fig_category_count_bar(category_counts), use_container_width=True)
 
     with col2:
         # Category pie chart
-        top_10_counts = category_counts[:10]
-        fig = px.pie(
-            values=top_10_counts.values,
-            names=top_10_counts.index,
-            title='Top 10 Categories Distribution',
-            hole=0.4
-        )
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_category_pie(category_counts[:10]), use_container_width=True)
 
     # Category insights table
     st.markdown("#### Category Statistics")
 
-    category_stats = df.groupby('category').agg({
-        'price': ['mean', 'min', 'max'],
-        'rating': 'mean',
-        'in_stock': 'sum',
-        'id': 'count'
-    }).round(2)
+    category_stats = summary[
+        ['avg_price', 'min_price', 'max_price', 'avg_rating', 'in_stock', 'count']
+    ].head(20).round(2)
 
     category_stats.columns = ['Avg Price', 'Min Price', 'Max Price', 'Avg Rating', 'In Stock', 'Total Books']
-    category_stats = category_stats.sort_values('Total Books', ascending=False).head(20)
     category_stats = category_stats.reset_index()
 
     st.dataframe(
@@ -446,11 +1163,12 @@ def show_category_analysis(df):
     )
 
 
-def show_availability_analysis(df):
+def show_availability_analysis(df, summaries):
     """
     Show availability and stock analysis.
 
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("Availability & Stock Analysis")
@@ -459,91 +1177,46 @@ def show_availability_analysis(df):
 
     with col1:
         # Stock status
-        stock_status = df['in_stock'].value_counts()
-        labels = ['In Stock' if x else 'Out of Stock' for x in stock_status.index]
-        fig = px.pie(
-            values=stock_status.values,
-            names=labels,
-            title='Stock Status',
-            color_discrete_sequence=['#2ecc71', '#e74c3c'],
-            hole=0.3
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        in_stock = summaries['overview']['in_stock']
+        st.plotly_chart(_fig_stock_status_pie(in_stock, len(df) - in_stock), use_container_width=True)
 
     with col2:
         # Stock quantity distribution
-        df_with_qty = df[df['stock_quantity'].notna()]
-        if not df_with_qty.empty:
-            fig = px.histogram(
-                df_with_qty,
-                x='stock_quantity',
-                nbins=20,
-                title='Stock Quantity Distribution',
-                labels={'stock_quantity': 'Stock Quantity', 'count': 'Number of Books'},
-                color_discrete_sequence=['#3498db']
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+        quantities = df['stock_quantity'].dropna().to_numpy()
+        if len(quantities):
+            st.plotly_chart(_fig_stock_quantity_histogram(quantities, summaries['etag']), use_container_width=True)
         else:
             st.info("No stock quantity data available")
 
     # Category-wise stock analysis
     st.markdown("#### Stock by Category (Top 15)")
 
-    category_stock = df.groupby('category').agg({
-        'in_stock': 'sum',
-        'id': 'count'
-    }).reset_index()
+    category_stock = summaries['categories'][['in_stock', 'count']].head(15).reset_index()
     category_stock.columns = ['Category', 'In Stock', 'Total']
     category_stock['Out of Stock'] = category_stock['Total'] - category_stock['In Stock']
-    category_stock = category_stock.sort_values('Total', ascending=False).head(15)
 
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        name='In Stock',
-        x=category_stock['Category'],
-        y=category_stock['In Stock'],
-        marker_color='lightgreen',
-        text=category_stock['In Stock'],
-        textposition='inside'
-    ))
-    fig.add_trace(go.Bar(
-        name='Out of Stock',
-        x=category_stock['Category'],
-        y=category_stock['Out of Stock'],
-        marker_color='lightcoral',
-        text=category_stock['Out of Stock'],
-        textposition='inside'
-    ))
-    fig.update_layout(
-        barmode='stack',
-        xaxis_title='Category',
-        yaxis_title='Number of Books',
-        xaxis_tickangle=-45,
-        height=500
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_fig_category_stock_bar(category_stock), use_container_width=True)
 
 
-def show_overview_metrics(df):
+def show_overview_metrics(summaries):
     """
     Display overview metrics.
 
-    @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
+    stats = summaries['overview']
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
         st.metric(
             "Total Books",
-            f"{len(df):,}",
+            f"{stats['total_books']:,}",
             help="Total number of books in database"
         )
 
     with col2:
-        avg_price = df['price'].mean()
+        avg_price = stats['avg_price']
         st.metric(
             "Avg Price",
             f"£{avg_price:.2f}",
@@ -551,7 +1224,7 @@ def show_overview_metrics(df):
         )
 
     with col3:
-        avg_rating = df['rating'].mean()
+        avg_rating = stats['avg_rating']
         st.metric(
             "Avg Rating",
             f"{avg_rating:.1f}/5",
@@ -559,8 +1232,8 @@ def show_overview_metrics(df):
         )
 
     with col4:
-        in_stock = int(df['in_stock'].sum())
-        stock_pct = (in_stock / len(df) * 100)
+        in_stock = stats['in_stock']
+        stock_pct = (in_stock / stats['total_books'] * 100)
         st.metric(
             "In Stock",
             f"{in_stock:,} ({stock_pct:.1f}%)",
@@ -568,7 +1241,7 @@ def show_overview_metrics(df):
         )
 
     with col5:
-        categories = df['category'].nunique()
+        categories = stats['categories']
         st.metric(
             "Categories",
             f"{categories}",
@@ -576,14 +1249,15 @@ def show_overview_metrics(df):
         )
 
 
-def show_time_analysis(df):
+def show_time_analysis(summaries):
     """
     Show time-based analysis.
 
-    @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
-    if 'scraped_at' not in df.columns or df['scraped_at'].isna().all():
+    daily_counts = summaries['daily_counts']
+    if daily_counts is None:
         st.info("No time data available for analysis")
         return
 
@@ -593,38 +1267,73 @@ def show_time_analysis(df):
 
     with col1:
         # Books scraped over time
-        df['scrape_date'] = df['scraped_at'].dt.date
-        daily_counts = df.groupby('scrape_date').size().reset_index(name='count')
-
-        fig = px.line(
-            daily_counts,
-            x='scrape_date',
-            y='count',
-            title='Books Scraped Over Time',
-            labels={'scrape_date': 'Date', 'count': 'Number of Books'},
-            markers=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_scrape_count_line(daily_counts), use_container_width=True)
 
     with col2:
         # Cumulative books
-        daily_counts['cumulative'] = daily_counts['count'].cumsum()
-
-        fig = px.area(
-            daily_counts,
-            x='scrape_date',
-            y='cumulative',
-            title='Cumulative Books Scraped',
-            labels={'scrape_date': 'Date', 'cumulative': 'Total Books'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_fig_scrape_cumulative_area(daily_counts), use_container_width=True)
 
 
-def show_data_table(df):
+@st.cache_data(ttl=300, max_entries=32)
+def _filtered_rows(_df, etag, category, rating, price_min, price_max):
+    """
+    Find the rows matching the explorer's filters.
+
+    @param {DataFrame} _df - Book data
+    @param {tuple} etag - Data version the frame belongs to
+    @param {str} category - Selected category or 'All'
+    @param {int|str} rating - Selected rating or 'All'
+    @param {float} price_min - Minimum price
+    @param {float} price_max - Maximum price
+    @returns {ndarray} Positions of the matching rows
+    """
+    # One combined numpy mask; rows are gathered only for the displayed columns
+    prices = _df['price'].to_numpy()
+    mask = (prices >= price_min) & (prices <= price_max)
+
+    if category != 'All':
+        # Compare the integer category codes rather than the labels
+        mask &= _df['category'].cat.codes.to_numpy() == _df['category'].cat.categories.get_loc(category)
+
+    if rating != 'All':
+        mask &= _df['rating'].to_numpy() == rating
+
+    return np.flatnonzero(mask)
+
+
+@st.cache_data(ttl=300, max_entries=8)
+def _filtered_csv(_df, etag, category, rating, price_min, price_max, display_cols):
+    """
+    Encode the filtered rows as CSV for the download button.
+
+    @param {DataFrame} _df - Book data
+    @param {tuple} etag - Data version the frame belongs to
+    @param {str} category - Selected category or 'All'
+    @param {int|str} rating - Selected rating or 'All'
+    @param {float} price_min - Minimum price
+    @param {float} price_max - Maximum price
+    @param {tuple} display_cols - Columns to export
+    @returns {bytes} CSV document
+    """
+    rows = _filtered_rows(_df, etag, category, rating, price_min, price_max)
+    filtered_df = _df.iloc[rows, _df.columns.get_indexer(display_cols)]
+
+    # Arrow's C++ writer encodes the CSV
+    csv_buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(filtered_df, preserve_index=False), csv_buffer)
+    return csv_buffer.getvalue()
+
+
+def show_data_table(df, summaries):
     """
     Show interactive data table.
 
+    Filter options come from the categorical dtype and the cached
+    summaries rather than from scanning the frame; the filtered rows
+    and the CSV export are cached per filter combination.
+
     @param {DataFrame} df - Book data
+    @param {dict} summaries - Shared summaries from precompute_summaries
     @returns {None}
     """
     st.subheader("Book Data Explorer")
@@ -633,56 +1342,60 @@ def show_data_table(df):
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        categories = ['All'] + sorted(df['category'].unique().tolist())
+        # Categories are built sorted from the observed values
+        categories = ['All'] + df['category'].cat.categories.tolist()
         selected_category = st.selectbox("Category", categories)
 
     with col2:
-        ratings = ['All'] + sorted(df['rating'].unique().tolist())
+        ratings = ['All'] + summaries['ratings'].index.tolist()
         selected_rating = st.selectbox("Rating", ratings)
 
     with col3:
         price_min = st.number_input("Min Price (£)", value=0.0, step=1.0)
 
     with col4:
-        price_max = st.number_input("Max Price (£)", value=float(df['price'].max()), step=1.0)
-
-    # Apply filters
-    filtered_df = df.copy()
-
-    if selected_category != 'All':
-        filtered_df = filtered_df[filtered_df['category'] == selected_category]
-
-    if selected_rating != 'All':
-        filtered_df = filtered_df[filtered_df['rating'] == selected_rating]
-
-    filtered_df = filtered_df[
-        (filtered_df['price'] >= price_min) &
-        (filtered_df['price'] <= price_max)
-    ]
+        price_max = st.number_input(
+            "Max Price (£)", value=float(summaries['categories']['max_price'].max()), step=1.0
+        )
 
-    st.write(f"Showing {len(filtered_df)} of {len(df)} books")
+    filters = (selected_category, selected_rating, price_min, price_max)
+    rows = _filtered_rows(df, summaries['etag'], *filters)
+    st.write(f"Showing {len(rows)} of {len(df)} books")
 
     # Column selection
     available_cols = ['title', 'price', 'rating', 'category', 'availability', 'upc', 'url']
     display_cols = st.multiselect(
         "Select columns to display",
-        options=[col for col in available_cols if col in filtered_df.columns],
+        options=[col for col in available_cols if col in df.columns],
         default=['title', 'price', 'rating', 'category', 'availability']
     )
 
     if display_cols:
+        # Pagination; only the visible page is sent to the browser
+        page_col1, page_col2 = st.columns(2)
+
+        with page_col1:
+            page_size = st.selectbox("Rows per page", [25, 50, 100], index=1)
+
+        with page_col2:
+            page_count = max(1, -(-len(rows) // page_size))
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+        column_positions = df.columns.get_indexer(display_cols)
+        page_rows = rows[(page - 1) * page_size:page * page_size]
+
         # Display table
         st.dataframe(
-            filtered_df[display_cols],
+            df.iloc[page_rows, column_positions],
             use_container_width=True,
             height=400
         )
+        st.caption(f"Page {page} of {page_count}")
 
         # Download button
-        csv = filtered_df[display_cols].to_csv(index=False)
         st.download_button(
             label="Download Filtered Data (CSV)",
-            data=csv,
+            data=_filtered_csv(df, summaries['etag'], *filters, tuple(display_cols)),
             file_name=f"books_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
@@ -694,6 +1407,8 @@ def main():
 
     @returns {None}
     """
+    setup_directories()
+
     # Initialize database
     init_database()
 
@@ -735,6 +1450,7 @@ def main():
 
         # Refresh data
         if st.button("Refresh Data", use_container_width=True):
+            load_data.clear()
             st.cache_data.clear()
             st.rerun()
 
@@ -745,6 +1461,7 @@ def main():
                     db_manager.drop_tables()
                     db_manager.create_tables()
                     st.success("Database cleared")
+                    load_data.clear()
                     st.cache_data.clear()
                     st.rerun()
 
@@ -766,8 +1483,10 @@ def main():
         st.info("No data available. Use the sidebar to scrape data!")
         return
 
+    summaries = precompute_summaries(df, data_etag(df))
+
     # Overview metrics
-    show_overview_metrics(df)
+    show_overview_metrics(summaries)
     st.markdown("---")
 
     # Tabs for different analyses
@@ -789,29 +1508,14 @@ def main():
         with col1:
             # Top categories
             st.markdown("#### Top 10 Categories")
-            top_cats = df['category'].value_counts().head(10)
-            fig = px.bar(
-                y=top_cats.index,
-                x=top_cats.values,
-                orientation='h',
-                color=top_cats.values,
-                color_continuous_scale='Greens'
-            )
-            fig.update_layout(showlegend=False, xaxis_title='Count', yaxis_title='')
-            st.plotly_chart(fig, use_container_width=True)
+            top_cats = summaries['categories']['count'].head(10)
+            st.plotly_chart(_fig_top_categories_bar(top_cats), use_container_width=True)
 
         with col2:
             # Price vs Rating
             st.markdown("#### Price vs Rating")
-            avg_by_rating = df.groupby('rating')['price'].mean()
-            fig = px.bar(
-                x=avg_by_rating.index,
-                y=avg_by_rating.values,
-                color=avg_by_rating.values,
-                color_continuous_scale='Viridis'
-            )
-            fig.update_layout(xaxis_title='Rating', yaxis_title='Avg Price (£)')
-            st.plotly_chart(fig, use_container_width=True)
+            avg_by_rating = summaries['ratings']['avg_price']
+            st.plotly_chart(_fig_avg_price_by_rating_bar(avg_by_rating), use_container_width=True)
 
         # # Recent additions
         # if 'created_at' in df.columns:
@@ -820,23 +1524,23 @@ def main():
         #     st.dataframe(recent, use_container_width=True, hide_index=True)
 
     with tab2:
-        show_price_analysis(df)
+        show_price_analysis(df, summaries)
 
     with tab3:
-        show_category_analysis(df)
+        show_category_analysis(df, summaries)
 
     with tab4:
-        show_rating_analysis(df)
+        show_rating_analysis(df, summaries)
 
     with tab5:
-        show_availability_analysis(df)
+        show_availability_analysis(df, summaries)
 
     with tab6:
-        show_advanced_analytics(df)
-        show_time_analysis(df)
+        show_advanced_analytics(df, summaries)
+        show_time_analysis(summaries)
 
     with tab7:
-        show_data_table(df)
+        show_data_table(df, summaries)
 
 
 if __name__ == "__main__":
@@ -11,11 +11,12 @@ of the application.
 
 import sys
 import argparse
+from pathlib import Path
 from loguru import logger
 
 from src.database.connection import db_manager
 from src.scraper.books_scraper import BooksScraper
-from src.utils.config import Config
+from src.utils.config import get_config
 
 
 def setup_logging():
@@ -30,7 +31,7 @@ def setup_logging():
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     )
     logger.add(
-        Config.LOGS_DIR / "app_{time}.log",
+        get_config().logs_dir / "app_{time}.log",
         rotation="1 day",
         retention="7 days",
         level="INFO"
@@ -96,11 +97,12 @@ def run_api():
     import uvicorn
     from src.api.routes import app
 
+    config = get_config()
     logger.info("Starting API server...")
     uvicorn.run(
         app,
-        host=Config.API_HOST,
-        port=Config.API_PORT,
+        host=config.api_host,
+        port=config.api_port,
         log_level="info"
     )
 
@@ -109,18 +111,23 @@ def run_dashboard():
     """
     Run the Streamlit dashboard.
 
+    The server is started in this process rather than through the
+    streamlit CLI, so the application modules (and db_manager) are
+    imported once instead of again in a child process.
+
     @returns {None}
     """
-    import subprocess
+    from streamlit.web import bootstrap
 
     logger.info("Starting Streamlit dashboard...")
-    subprocess.run([
-        "streamlit",
-        "run",
-        "dashboard/app.py",
-        "--server.port",
-        str(Config.DASHBOARD_PORT)
-    ])
+    flag_options = {"server_port": get_config().dashboard_port}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run(
+        str(Path(__file__).parent / "dashboard" / "app.py"),
+        False,
+        [],
+        flag_options
+    )
 
 
 def main():
@@ -129,6 +136,7 @@ def main():
 
     @returns {None}
     """
+    get_config().setup_directories()
     setup_logging()
 
     parser = argparse.ArgumentParser(
@@ -5,7 +5,6 @@ Script to reset the database with new schema.
 """
 
 from src.database.connection import db_manager
-from src.utils.config import Config
 from loguru import logger
 
 
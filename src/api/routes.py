@@ -9,7 +9,8 @@ This module defines REST API endpoints for accessing scraped data.
 """
 
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from loguru import logger
@@ -59,7 +60,8 @@ class ScrapeRequest(BaseModel):
 app = FastAPI(
     title="Data Pipeline API",
     description="API for automated data extraction and retrieval",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -69,6 +71,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers only let cross-origin clients read the paging cursor if it is exposed
+    expose_headers=["X-Next-After-Id"],
 )
 
 
@@ -96,31 +100,48 @@ async def root():
     return {
         "message": "Data Pipeline API",
         "version": "1.0.0",
-        "endpoints": ["/books", "/statistics", "/scrape"]
+        "endpoints": ["/books", "/books/stream", "/books/export.csv", "/statistics", "/scrape"]
     }
 
 
 @app.get("/books", response_model=List[BookResponse])
-async def get_books(
+def get_books(
+        response: Response,
         limit: Optional[int] = Query(100, description="Maximum number of books to return"),
+        after_id: Optional[int] = Query(None, description="Return books with an id greater than this (start with 0)"),
         min_price: Optional[float] = Query(None, description="Minimum price filter"),
         max_price: Optional[float] = Query(None, description="Maximum price filter")
 ):
     """
     Get all books with optional filters.
 
+    Pages are read with keyset pagination: pass after_id=0 for the
+    first page, then the X-Next-After-Id header of each response for
+    the next one. One extra row is read to tell whether another page
+    follows, so the header is omitted on the last page.
+
     @route GET /books
     @queryparam {int} limit - Maximum number of results
+    @queryparam {int} after_id - Only return books with a greater id
     @queryparam {float} min_price - Minimum price filter
     @queryparam {float} max_price - Maximum price filter
     @returns {list} List of books
     @throws {HTTPException} 500 if database error occurs
     """
     try:
-        if min_price is not None and max_price is not None:
-            books = db_manager.get_books_by_price_range(min_price, max_price)
+        price_filtered = min_price is not None and max_price is not None
+        # Results ordered by id can be paged; read one row past the page to detect the end
+        ordered_by_id = price_filtered or after_id is not None
+        fetch_limit = limit + 1 if ordered_by_id and limit else limit
+
+        if price_filtered:
+            books = db_manager.get_books_by_price_range(min_price, max_price, limit=fetch_limit, after_id=after_id)
         else:
-            books = db_manager.get_all_books(limit=limit)
+            books = db_manager.get_all_books(limit=fetch_limit, after_id=after_id)
+
+        if fetch_limit != limit and len(books) > limit:
+            books = books[:limit]
+            response.headers["X-Next-After-Id"] = str(books[-1]["id"])
 
         return books
     except Exception as e:
@@ -128,8 +149,37 @@ async def get_books(
         raise HTTPException(status_code=500, detail="Failed to retrieve books")
 
 
+@app.get("/books/stream")
+def stream_books():
+    """
+    Stream every book as newline-delimited JSON.
+
+    Preferred over /books for large exports: rows are sent as they are
+    read instead of being collected into one response.
+
+    @route GET /books/stream
+    @returns {StreamingResponse} NDJSON stream with one book per line
+    """
+    return StreamingResponse(db_manager.get_books_stream(), media_type="application/x-ndjson")
+
+
+@app.get("/books/export.csv")
+def export_books_csv():
+    """
+    Stream every book as a CSV download.
+
+    @route GET /books/export.csv
+    @returns {StreamingResponse} CSV stream with a header row
+    """
+    return StreamingResponse(
+        db_manager.get_books_csv_stream(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="books.csv"'}
+    )
+
+
 @app.get("/statistics", response_model=StatisticsResponse)
-async def get_statistics():
+def get_statistics():
     """
     Get database statistics.
 
@@ -146,7 +196,7 @@ async def get_statistics():
 
 
 @app.post("/scrape")
-async def trigger_scrape(request: ScrapeRequest):
+def trigger_scrape(request: ScrapeRequest):
     """
     Trigger scraping process.
 
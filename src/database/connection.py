@@ -8,15 +8,44 @@ This module handles all database connections and CRUD operations.
 @date 2025
 """
 
-from typing import List, Optional, Dict, Any
+import io
+import time
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterator
 from contextlib import contextmanager
-from sqlalchemy import create_engine, inspect
+import orjson
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from sqlalchemy import create_engine, inspect, make_url, select, insert, update, func, case, cast, text, Float
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from loguru import logger
 
-from src.utils.config import Config
-from src.database.models import Base, Book
+from src.utils.config import get_config
+from src.database.models import Base, Book, utcnow
+
+# Arrow types for the Python types of the book columns
+_ARROW_TYPES = {
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    datetime: pa.timestamp('us'),
+}
+
+# Seconds a get_statistics result is served from memory
+_STATS_TTL = 30
+
+# Rows fetched per round trip when a full-table read uses a server-side cursor
+_YIELD_PER = 2000
+
+# Insert statements are built once; SQLAlchemy then reuses their compiled form
+_INSERT_STMT = insert(Book.__table__)
+_INSERT_IGNORE_STMTS = {
+    dialect: dialect_insert(Book).on_conflict_do_nothing(index_elements=['upc']).returning(Book.id)
+    for dialect, dialect_insert in (('postgresql', pg_insert), ('sqlite', sqlite_insert))
+}
 
 
 class DatabaseManager:
@@ -32,9 +61,10 @@ class DatabaseManager:
 
         @constructor
         """
-        self.database_url = Config.get_database_url()
+        self.database_url = get_config().get_database_url()
         self.engine = None
         self.SessionLocal = None
+        self._stats_cache = None  # (monotonic timestamp, statistics)
 
     def initialize(self) -> None:
         """
@@ -43,12 +73,21 @@ class DatabaseManager:
         @returns {None}
         @throws {SQLAlchemyError} If database connection fails
         """
+        connect_args = {}
+        if make_url(self.database_url).get_backend_name() == 'postgresql':
+            # Name the sessions in pg_stat_activity and skip JIT, which only
+            # adds compile time to the small aggregate queries run here
+            connect_args = {"application_name": "pipeline", "options": "-c jit=off"}
+
         try:
             self.engine = create_engine(
                 self.database_url,
                 pool_pre_ping=True,
                 pool_size=10,
                 max_overflow=20,
+                pool_recycle=1800,
+                pool_timeout=5,
+                connect_args=connect_args,
                 echo=False
             )
             self.SessionLocal = sessionmaker(
@@ -65,10 +104,30 @@ class DatabaseManager:
         """
         Create all tables defined in models.
 
+        Indexes added to an existing table are created as well, and on
+        PostgreSQL the UTC scraped_at default is applied to existing
+        tables, so older databases pick them up without a reset. Rows
+        missing scraped_at fall back to their created_at.
+
         @returns {None}
         """
         try:
             Base.metadata.create_all(bind=self.engine)
+            for index in Book.__table__.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+            if self.engine.dialect.name == 'postgresql':
+                with self.engine.begin() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE books ALTER COLUMN scraped_at "
+                        f"SET DEFAULT {utcnow().compile(dialect=self.engine.dialect)}"
+                    ))
+            # Rows bulk-loaded while scraped_at had no default were left NULL
+            with self.engine.begin() as conn:
+                conn.execute(
+                    update(Book.__table__)
+                    .where(Book.scraped_at.is_(None))
+                    .values(scraped_at=Book.created_at)
+                )
             logger.info("Database tables created successfully")
         except SQLAlchemyError as e:
             logger.error(f"Failed to create tables: {e}")
@@ -82,6 +141,7 @@ class DatabaseManager:
         """
         try:
             Base.metadata.drop_all(bind=self.engine)
+            self._stats_cache = None
             logger.warning("All database tables dropped")
         except SQLAlchemyError as e:
             logger.error(f"Failed to drop tables: {e}")
@@ -121,14 +181,101 @@ class DatabaseManager:
                 session.add(book)
                 session.flush()
                 logger.info(f"Inserted book: {book.title}")
-                return book.id
+                book_id = book.id
+            self._stats_cache = None
+            return book_id
         except SQLAlchemyError as e:
             logger.error(f"Failed to insert book: {e}")
             return None
 
     def insert_books_bulk(self, books_data: List[Dict[str, Any]]) -> int:
         """
-        Insert multiple book records in bulk with optimized error handling.
+        Insert multiple book records in bulk, skipping duplicate UPCs.
+
+        PostgreSQL loads the batch with COPY, SQLite with a single
+        INSERT ... ON CONFLICT DO NOTHING executemany, and other
+        databases through a plain Core executemany.
+
+        @param {list} books_data - List of book dictionaries
+        @returns {int} Number of books inserted
+        """
+        if not books_data:
+            return 0
+
+        dialect = self.engine.dialect.name
+        if dialect == 'postgresql':
+            inserted_count = self.insert_books_copy(books_data)
+        elif dialect == 'sqlite':
+            inserted_count = self._insert_books_executemany(books_data)
+        else:
+            inserted_count = self._insert_books_core(books_data)
+
+        return inserted_count
+
+    def _prepare_rows(self, books_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Give every book a value for each client-side column.
+
+        Bulk paths bypass the ORM, so Python-side column defaults are
+        applied here and missing fields become None. Columns with both
+        kinds of default (scraped_at) get the Python one, so tables
+        created before the server default existed are still filled in.
+
+        @param {list} books_data - List of book dictionaries
+        @returns {list} Book dictionaries sharing the same keys
+        """
+        template = {
+            col.name: (col.default.arg(None) if col.default.is_callable else col.default.arg)
+            if col.default is not None else None
+            for col in Book.__table__.columns
+            if not col.primary_key and (col.default is not None or col.server_default is None)
+        }
+        return [{**template, **book_data} for book_data in books_data]
+
+    def _insert_books_executemany(self, books_data: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple book records with one INSERT ... ON CONFLICT DO NOTHING executemany.
+
+        The database skips books whose UPC is already stored, so no
+        duplicate lookup is needed. Supported on PostgreSQL and SQLite.
+
+        @param {list} books_data - List of book dictionaries
+        @returns {int} Number of books inserted
+        """
+        stmt = _INSERT_IGNORE_STMTS[self.engine.dialect.name]
+
+        try:
+            with self.get_session() as session:
+                result = session.connection().execute(stmt, self._prepare_rows(books_data))
+                inserted_count = len(result.all())
+        except SQLAlchemyError as e:
+            logger.warning(f"Executemany insert failed: {e}. Falling back to plain inserts...")
+            return self._insert_books_core(books_data)
+
+        self._stats_cache = None
+        logger.info(f"Insert complete: {inserted_count} books inserted")
+        return inserted_count
+
+    def _existing_upcs(self, session: Session, books_data: List[Dict[str, Any]]) -> set:
+        """
+        Find which of the batch's UPCs are already stored, in one query.
+
+        @param {Session} session - Active database session
+        @param {list} books_data - List of book dictionaries
+        @returns {set} UPCs from the batch that already exist
+        """
+        upcs = {book_data['upc'] for book_data in books_data if book_data.get('upc')}
+        if not upcs:
+            return set()
+        return set(session.scalars(select(Book.upc).where(Book.upc.in_(upcs))))
+
+    def _insert_books_core(self, books_data: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple book records with a portable Core executemany.
+
+        Fallback for databases without a native bulk path. Stored UPCs
+        are looked up once per batch and duplicates within the batch
+        are skipped as well.
 
         @param {list} books_data - List of book dictionaries
         @returns {int} Number of books inserted
@@ -136,46 +283,53 @@ class DatabaseManager:
         inserted_count = 0
         failed_books = []
 
-        # First pass: Try bulk insert
+        # First pass: one executemany for every book not already stored
         try:
             with self.get_session() as session:
-                books_to_insert = []
+                seen_upcs = self._existing_upcs(session, books_data)
+                rows_to_insert = []
 
                 for book_data in books_data:
-                    # Skip if UPC already exists in the batch
-                    if 'upc' in book_data and book_data.get('upc'):
-                        existing = session.query(Book).filter_by(upc=book_data['upc']).first()
-                        if existing:
-                            logger.debug(f"Book with UPC {book_data['upc']} already exists")
+                    upc = book_data.get('upc')
+                    if upc:
+                        if upc in seen_upcs:
+                            logger.debug(f"Book with UPC {upc} already exists")
                             continue
+                        seen_upcs.add(upc)
 
-                    books_to_insert.append(Book(**book_data))
+                    rows_to_insert.append(book_data)
 
-                if books_to_insert:
-                    session.bulk_save_objects(books_to_insert)
+                if rows_to_insert:
+                    session.execute(_INSERT_STMT, self._prepare_rows(rows_to_insert))
                     session.commit()
-                    inserted_count = len(books_to_insert)
-                    logger.info(f"Bulk insert successful: {inserted_count} books")
-                    return inserted_count
+                inserted_count = len(rows_to_insert)
+                self._stats_cache = None
+                logger.info(f"Bulk insert successful: {inserted_count} books")
+                return inserted_count
 
         except Exception as e:
             logger.warning(f"Bulk insert failed: {e}. Trying individual inserts...")
-            session.rollback()
 
-        # Second pass: Insert individually if bulk fails
+        # Second pass: one INSERT per book, so a bad row only loses itself
+        try:
+            with self.get_session() as session:
+                seen_upcs = self._existing_upcs(session, books_data)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to look up existing UPCs: {e}")
+            return 0
+
         for book_data in books_data:
+            upc = book_data.get('upc')
+            if upc and upc in seen_upcs:
+                continue
+
             try:
                 with self.get_session() as session:
-                    # Check for duplicates
-                    if 'upc' in book_data and book_data.get('upc'):
-                        existing = session.query(Book).filter_by(upc=book_data['upc']).first()
-                        if existing:
-                            continue
-
-                    book = Book(**book_data)
-                    session.add(book)
+                    session.execute(_INSERT_STMT, book_data)
                     session.commit()
                     inserted_count += 1
+                    if upc:
+                        seen_upcs.add(upc)
 
             except Exception as e:
                 logger.warning(f"Failed to insert '{book_data.get('title', 'Unknown')}': {str(e)[:100]}")
@@ -185,56 +339,316 @@ class DatabaseManager:
         if failed_books:
             logger.warning(f"Failed to insert {len(failed_books)} books: {failed_books[:5]}")
 
+        self._stats_cache = None
         logger.info(f"Insert complete: {inserted_count} books inserted")
         return inserted_count
 
-    def get_all_books(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def insert_books_copy(self, books_data: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple book records through PostgreSQL COPY.
+
+        Books are encoded once as an Arrow table, streamed as CSV into a
+        temporary staging table and moved into books with
+        ON CONFLICT DO NOTHING, so duplicate UPCs are skipped by the
+        database. A failed COPY falls back to an ON CONFLICT executemany;
+        other dialects should use insert_books_bulk.
+
+        The staging table only has the copied columns and already stored
+        or repeated UPCs are filtered out before the insert, so skipped
+        rows never draw a value from the id sequence.
+
+        @param {list} books_data - List of book dictionaries
+        @returns {int} Number of books inserted
+        @throws {ValueError} If the database is not PostgreSQL
+        """
+        if not books_data:
+            return 0
+        if self.engine.dialect.name != 'postgresql':
+            raise ValueError(f"COPY insert requires PostgreSQL, not {self.engine.dialect.name}")
+
+        # COPY bypasses Python-side column defaults, so apply them up front
+        rows = self._prepare_rows(books_data)
+
+        columns = [col for col in Book.__table__.columns if col.name in rows[0]]
+        schema = pa.schema([(col.name, _ARROW_TYPES[col.type.python_type]) for col in columns])
+        buffer = io.BytesIO()
+        pa_csv.write_csv(
+            pa.Table.from_pylist(rows, schema=schema),
+            buffer,
+            pa_csv.WriteOptions(include_header=False)
+        )
+        buffer.seek(0)
+
+        names = ", ".join(col.name for col in columns)
+        try:
+            with self.get_session() as session:
+                cursor = session.connection().connection.cursor()
+                try:
+                    cursor.execute(
+                        f"CREATE TEMP TABLE books_stage ON COMMIT DROP AS SELECT {names} FROM books WITH NO DATA"
+                    )
+                    cursor.copy_expert(f"COPY books_stage ({names}) FROM STDIN WITH (FORMAT csv)", buffer)
+                    # PostgreSQL draws the id before checking ON CONFLICT, so known
+                    # and repeated UPCs are filtered out first to keep ids dense
+                    cursor.execute(
+                        f"INSERT INTO books ({names}) SELECT {names} FROM ("
+                        f"SELECT *, ctid AS stage_row, "
+                        f"row_number() OVER (PARTITION BY upc ORDER BY ctid) AS upc_rank FROM books_stage"
+                        f") AS stage WHERE (upc IS NULL OR upc_rank = 1) "
+                        f"AND NOT EXISTS (SELECT 1 FROM books WHERE books.upc = stage.upc) "
+                        f"ORDER BY stage_row ON CONFLICT (upc) DO NOTHING"
+                    )
+                    inserted_count = cursor.rowcount
+                finally:
+                    cursor.close()
+        except Exception as e:
+            logger.warning(f"COPY insert failed: {e}. Falling back to executemany insert...")
+            return self._insert_books_executemany(books_data)
+
+        self._stats_cache = None
+        logger.info(f"COPY insert complete: {inserted_count} books inserted")
+        return inserted_count
+
+    def get_all_books(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve all books from database.
 
+        Rows are read with a Core select as plain mappings, without
+        building ORM objects; timestamps are returned as datetimes.
+        Newest books come first unless after_id is given, in which case
+        books are paged by ascending id starting after that id.
+
+        The whole result is returned as one list; use get_books_stream
+        or keyset pages with after_id to read large tables in bounded memory.
+
         @param {int|None} limit - Maximum number of records to return
+        @param {int|None} after_id - Return only books with a greater id (keyset pagination)
         @returns {list} List of book dictionaries
         """
         try:
             with self.get_session() as session:
-                query = session.query(Book).order_by(Book.created_at.desc())
+                stmt = select(*Book.__table__.columns)
+                if after_id is not None:
+                    stmt = stmt.where(Book.id > after_id).order_by(Book.id)
+                else:
+                    stmt = stmt.order_by(Book.created_at.desc())
                 if limit:
-                    query = query.limit(limit)
-                books = query.all()
-                return [book.to_dict() for book in books]
+                    stmt = stmt.limit(limit)
+                return [dict(row) for row in session.execute(stmt).mappings()]
         except SQLAlchemyError as e:
             logger.error(f"Failed to retrieve books: {e}")
             return []
 
+    def get_books_stream(self, chunk_size: int = 1000) -> Iterator[bytes]:
+        """
+        Stream all books as newline-delimited JSON.
+
+        Rows are fetched from a server-side cursor in chunks of chunk_size
+        and each chunk is encoded as it arrives, so memory stays flat
+        regardless of table size.
+
+        @param {int} chunk_size - Rows fetched and encoded per chunk
+        @yields {bytes} NDJSON lines for one chunk of books
+        @throws {SQLAlchemyError} If reading fails part-way through
+        """
+        columns = [Book.id, Book.title, Book.price, Book.availability, Book.rating, Book.category, Book.url]
+
+        try:
+            with self.get_session() as session:
+                result = session.execute(
+                    select(*columns).order_by(Book.id).execution_options(yield_per=chunk_size)
+                )
+                for partition in result.mappings().partitions():
+                    yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in partition)
+        except SQLAlchemyError as e:
+            # The response has already started, so re-raise to abort it
+            # rather than end a truncated body as if it were complete
+            logger.error(f"Failed to stream books: {e}")
+            raise
+
+    def get_books_csv_stream(self, chunk_size: int = 1000) -> Iterator[bytes]:
+        """
+        Stream all books as CSV.
+
+        Each chunk read from the server-side cursor is written as an
+        Arrow record batch by the C++ CSV writer, so the document is
+        never held in memory as a whole. The header row comes first.
+
+        @param {int} chunk_size - Rows fetched and encoded per chunk
+        @yields {bytes} CSV text for one chunk of books
+        @throws {SQLAlchemyError} If reading fails part-way through
+        """
+        columns = [Book.id, Book.title, Book.price, Book.availability, Book.rating, Book.category, Book.url]
+        schema = pa.schema([(col.name, _ARROW_TYPES[col.type.python_type]) for col in columns])
+        buffer = io.BytesIO()
+
+        try:
+            with self.get_session() as session, pa_csv.CSVWriter(buffer, schema) as writer:
+                result = session.execute(
+                    select(*columns).order_by(Book.id).execution_options(yield_per=chunk_size)
+                )
+                for rows in result.partitions():
+                    writer.write_batch(pa.RecordBatch.from_arrays(
+                        [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                        schema=schema
+                    ))
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            # Only the header is left over when the table is empty
+            if buffer.getvalue():
+                yield buffer.getvalue()
+        except SQLAlchemyError as e:
+            # Re-raise so a partly sent export is aborted, not left looking complete
+            logger.error(f"Failed to stream books as CSV: {e}")
+            raise
+
+    def get_books_table(self, columns: Optional[List[str]] = None) -> pa.Table:
+        """
+        Retrieve all books as a columnar Arrow table.
+
+        Rows come from a Core select on a server-side cursor and each
+        fetched chunk is transposed straight into an Arrow record batch,
+        skipping ORM objects and per-row dictionaries.
+
+        @param {list|None} columns - Names of the columns to fetch (None for all)
+        @returns {pyarrow.Table} Table with one column per requested books column
+        """
+        table_columns = Book.__table__.columns
+        columns = list(table_columns) if columns is None else [table_columns[name] for name in columns]
+        schema = pa.schema([(col.name, _ARROW_TYPES[col.type.python_type]) for col in columns])
+
+        try:
+            with self.get_session() as session:
+                result = session.execute(
+                    select(*columns)
+                    .order_by(Book.created_at.desc())
+                    .execution_options(yield_per=_YIELD_PER)
+                )
+                batches = [
+                    pa.RecordBatch.from_arrays(
+                        [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                        schema=schema
+                    )
+                    for rows in result.partitions()
+                ]
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to retrieve books table: {e}")
+            return schema.empty_table()
+
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def get_books_signature(self) -> List[Any]:
+        """
+        Get a cheap fingerprint of the books table.
+
+        @returns {list} Row count and ISO timestamp of the latest scrape
+        """
+        try:
+            with self.get_session() as session:
+                count, latest = session.execute(
+                    select(func.count(Book.id), func.max(Book.scraped_at))
+                ).one()
+                return [count, latest.isoformat() if latest else None]
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get books signature: {e}")
+            return [0, None]
+
     def get_books_by_price_range(
             self,
             min_price: float,
-            max_price: float
+            max_price: float,
+            limit: Optional[int] = None,
+            after_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get books within a specific price range.
+        Get books within a specific price range, ordered by id.
 
         @param {float} min_price - Minimum price
         @param {float} max_price - Maximum price
+        @param {int|None} limit - Maximum number of records to return
+        @param {int|None} after_id - Return only books with a greater id (keyset pagination)
         @returns {list} List of book dictionaries
         """
         try:
             with self.get_session() as session:
-                books = session.query(Book).filter(
+                stmt = select(*Book.__table__.columns).where(
                     Book.price >= min_price,
                     Book.price <= max_price
-                ).all()
-                return [book.to_dict() for book in books]
+                ).order_by(Book.id)
+                if after_id is not None:
+                    stmt = stmt.where(Book.id > after_id)
+                if limit:
+                    stmt = stmt.limit(limit)
+                return [dict(row) for row in session.execute(stmt).mappings()]
         except SQLAlchemyError as e:
             logger.error(f"Failed to retrieve books by price: {e}")
             return []
 
+    def get_category_statistics(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate per-category statistics in the database.
+
+        Books without a category are grouped under 'Unknown' and a book
+        counts as in stock when its availability mentions "in stock".
+
+        @returns {list} One dictionary per category, largest categories first
+        """
+        category = func.coalesce(Book.category, 'Unknown').label('category')
+        in_stock = case((func.lower(Book.availability).like('%in stock%'), 1), else_=0)
+
+        try:
+            with self.get_session() as session:
+                rows = session.execute(
+                    select(
+                        category,
+                        func.count(Book.id).label('count'),
+                        cast(func.avg(Book.price), Float).label('avg_price'),
+                        cast(func.min(Book.price), Float).label('min_price'),
+                        cast(func.max(Book.price), Float).label('max_price'),
+                        cast(func.avg(func.coalesce(Book.rating, 0)), Float).label('avg_rating'),
+                        func.sum(in_stock).label('in_stock')
+                    ).group_by(category).order_by(func.count(Book.id).desc(), category)
+                ).mappings().all()
+                return [dict(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get category statistics: {e}")
+            return []
+
+    def get_rating_statistics(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate book counts and average prices per rating in the database.
+
+        @returns {list} One dictionary per rating in ascending order, unrated books as 0
+        """
+        rating = func.coalesce(Book.rating, 0).label('rating')
+
+        try:
+            with self.get_session() as session:
+                rows = session.execute(
+                    select(
+                        rating,
+                        func.count(Book.id).label('count'),
+                        cast(func.avg(Book.price), Float).label('avg_price')
+                    ).group_by(rating).order_by(rating)
+                ).mappings().all()
+                return [dict(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get rating statistics: {e}")
+            return []
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get database statistics.
 
+        Results are kept in memory for _STATS_TTL seconds and dropped
+        whenever books are inserted.
+
         @returns {dict} Dictionary containing various statistics
         """
+        if self._stats_cache and time.monotonic() - self._stats_cache[0] < _STATS_TTL:
+            return self._stats_cache[1]
+
         try:
             with self.get_session() as session:
                 from sqlalchemy import func
@@ -246,12 +660,14 @@ class DatabaseManager:
                     func.max(Book.price).label('max_price')
                 ).first()
 
-                return {
+                result = {
                     'total_books': stats.total_books or 0,
                     'avg_price': float(stats.avg_price) if stats.avg_price else 0.0,
                     'min_price': float(stats.min_price) if stats.min_price else 0.0,
                     'max_price': float(stats.max_price) if stats.max_price else 0.0,
                 }
+            self._stats_cache = (time.monotonic(), result)
+            return result
         except SQLAlchemyError as e:
             logger.error(f"Failed to get statistics: {e}")
             return {}
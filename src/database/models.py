@@ -9,13 +9,47 @@ This module defines SQLAlchemy ORM models for storing scraped data.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, rendered per dialect.
+
+    @class utcnow
+    @extends {FunctionElement}
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw) -> str:
+    """
+    Render utcnow for SQLite and other databases whose CURRENT_TIMESTAMP is UTC.
+
+    @returns {str} SQL expression
+    """
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, 'postgresql')
+def _compile_utcnow_postgresql(element, compiler, **kw) -> str:
+    """
+    Render utcnow for PostgreSQL, whose now() follows the session time zone.
+
+    @returns {str} SQL expression
+    """
+    return "timezone('utc', now())"
+
+
 class Book(Base):
     """
     Book model representing scraped book data.
@@ -67,10 +101,17 @@ class Book(Base):
     image_url = Column(Text, nullable=True)
 
     # Metadata
-    scraped_at = Column(DateTime, default=datetime.utcnow)
+    scraped_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # Composite indexes for the dashboard filters and newest-first listings
+    __table_args__ = (
+        Index('ix_books_cat_price', 'category', 'price'),
+        Index('ix_books_rating_price', 'rating', 'price'),
+        Index('ix_books_created_desc', created_at.desc()),
+    )
+
     def __repr__(self) -> str:
         """
         String representation of Book object.
@@ -98,7 +98,11 @@ retry logic, error handling, and logging.
 
 import time
 import ssl
+import dbm
+import shelve
+import threading
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional, Dict, Any
 import requests
 from requests.adapters import HTTPAdapter
@@ -106,7 +110,63 @@ from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from loguru import logger
 
-from src.utils.config import Config
+from src.utils.config import get_config
+
+try:
+    import fcntl
+except ImportError:  # Windows: the HTTP cache is then only safe for one process at a time
+    fcntl = None
+
+# Bodies larger than this are not written to the on-disk HTTP cache
+_HTTP_CACHE_MAX_BODY = 2 * 1024 * 1024
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests start per second.
+
+    Up to `rate` requests may go out back to back; after that callers
+    are paced to `rate` per second as tokens refill.
+
+    @class RateLimiter
+    """
+
+    def __init__(self, rate: float, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the limiter with a full bucket.
+
+        @constructor
+        @param {float} rate - Requests allowed per second (0 or less disables limiting)
+        @param {Function} clock - Monotonic time source in seconds
+        @param {Function} sleep - Called with the number of seconds to wait
+        """
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+
+        @returns {None}
+        """
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
 
 
 class BaseScraper(ABC):
@@ -129,6 +189,23 @@ class BaseScraper(ABC):
         self.verify_ssl = verify_ssl
         self.session = requests.Session()
 
+        config = get_config()
+
+        # Read once here rather than on every fetch_page call
+        self._timeout = config.request_timeout
+        self._max_retries = config.max_retries
+
+        # Caps in-flight requests across every thread sharing this scraper
+        self._request_slots = threading.BoundedSemaphore(config.max_workers)
+
+        # Politeness budget: at most requests_per_second requests start each second
+        self.limiter = RateLimiter(config.requests_per_second)
+
+        # ETag / Last-Modified validators and bodies of earlier responses, per URL
+        self._http_cache_lock = threading.Lock()
+        self._http_cache_owner = None
+        self._http_cache = self._open_http_cache(config.data_dir)
+
         # Configure session headers
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -141,13 +218,17 @@ class BaseScraper(ABC):
 
         # Configure retry strategy
         retry_strategy = Retry(
-            total=Config.MAX_RETRIES,
+            total=self._max_retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per concurrent request, so keep-alive sockets are reused
+        adapter = HTTPAdapter(
+            pool_maxsize=config.max_workers,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -157,24 +238,58 @@ class BaseScraper(ABC):
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             logger.warning("SSL verification disabled - use only for development!")
 
-    def fetch_page(self, url: str, retries: int = Config.MAX_RETRIES) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str, retries: Optional[int] = None) -> Optional[BeautifulSoup]:
         """
         Fetch and parse a web page with retry logic.
 
         @param {str} url - URL to fetch
-        @param {int} retries - Number of retry attempts
+        @param {int|None} retries - Number of retry attempts (defaults to the configured max_retries)
         @returns {BeautifulSoup|None} Parsed HTML or None if failed
         """
+        html = self._fetch_bytes(url, retries)
+        return self._parse(html) if html is not None else None
+
+    def _fetch_bytes(self, url: str, retries: Optional[int] = None) -> Optional[bytes]:
+        """
+        Download a page body with retry logic.
+
+        Pages fetched in earlier runs are revalidated with
+        If-None-Match / If-Modified-Since; on 304 Not Modified the stored
+        body is used.
+
+        @param {str} url - URL to fetch
+        @param {int|None} retries - Number of retry attempts (defaults to the configured max_retries)
+        @returns {bytes|None} Raw page content or None if failed
+        """
+        if retries is None:
+            retries = self._max_retries
+
+        cached = self._get_cached_response(url)
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
         for attempt in range(retries):
             try:
-                response = self.session.get(
-                    url,
-                    timeout=Config.REQUEST_TIMEOUT,
-                    verify=self.verify_ssl
-                )
+                self.limiter.acquire()
+                with self._request_slots:
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=self._timeout,
+                        verify=self.verify_ssl
+                    )
+                if response.status_code == 304 and cached:
+                    logger.debug(f"Not modified, using cached copy: {url}")
+                    return cached['body']
+
                 response.raise_for_status()
-                logger.info(f"Successfully fetched: {url}")
-                return BeautifulSoup(response.content, 'html.parser')
+                logger.debug(f"Successfully fetched: {url}")
+                self._store_response(url, response)
+                return response.content
 
             except requests.exceptions.SSLError as e:
                 logger.error(f"SSL Error for {url}: {e}")
@@ -192,6 +307,84 @@ class BaseScraper(ABC):
                     logger.error(f"Failed to fetch {url} after {retries} attempts")
                     return None
 
+    def _parse(self, html: bytes) -> BeautifulSoup:
+        """
+        Parse an HTML document with the C-backed lxml parser.
+
+        @param {bytes} html - Raw page content
+        @returns {BeautifulSoup} Parsed document
+        """
+        return BeautifulSoup(html, 'lxml')
+
+    def _open_http_cache(self, data_dir: Path) -> Optional[shelve.Shelf]:
+        """
+        Open the on-disk HTTP cache and claim it for this process.
+
+        The shelf is not safe for concurrent writers, so an exclusive
+        lock on http_cache.lock is held while it is open. Any other
+        scraper, e.g. the API's while the dashboard holds one, runs
+        without the cache instead of sharing it.
+
+        @param {Path} data_dir - Directory holding the cache files
+        @returns {Shelf|None} Open shelf, or None if it is unavailable
+        """
+        try:
+            data_dir.mkdir(parents=True, exist_ok=True)
+            owner = open(data_dir / "http_cache.lock", "a")
+        except OSError as e:
+            logger.warning(f"HTTP cache unavailable, pages will always be downloaded: {e}")
+            return None
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(owner, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            cache = shelve.open(str(data_dir / "http_cache"))
+        except dbm.error as e:  # includes OSError, e.g. the lock is held
+            owner.close()
+            logger.warning(f"HTTP cache unavailable, pages will always be downloaded: {e}")
+            return None
+
+        self._http_cache_owner = owner
+        return cache
+
+    def _get_cached_response(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the stored validators and body for a URL.
+
+        @param {str} url - Page URL
+        @returns {dict|None} Cached etag, last_modified and body, or None
+        """
+        if self._http_cache is None:
+            return None
+        with self._http_cache_lock:
+            return self._http_cache.get(url)
+
+    def _store_response(self, url: str, response: requests.Response) -> None:
+        """
+        Remember a response's body if the server sent validators for it.
+
+        Responses without validators, or with bodies over
+        _HTTP_CACHE_MAX_BODY, drop any entry stored for the URL so stale
+        validators are not sent again.
+
+        @param {str} url - Page URL
+        @param {Response} response - Successful response
+        @returns {None}
+        """
+        if self._http_cache is None:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._http_cache_lock:
+            if not (etag or last_modified) or len(response.content) > _HTTP_CACHE_MAX_BODY:
+                self._http_cache.pop(url, None)
+                return
+            self._http_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': response.content
+            }
+
     @abstractmethod
     def scrape(self) -> list:
         """
@@ -204,9 +397,16 @@ class BaseScraper(ABC):
 
     def close(self) -> None:
         """
-        Close the requests session.
+        Close the requests session and the HTTP cache.
 
         @returns {None}
         """
         self.session.close()
+        if self._http_cache is not None:
+            with self._http_cache_lock:
+                self._http_cache.close()
+                self._http_cache = None
+        if self._http_cache_owner is not None:
+            self._http_cache_owner.close()
+            self._http_cache_owner = None
         logger.info("Scraper session closed")
\ No newline at end of file
@@ -10,11 +10,19 @@ book data from books.toscrape.com.
 """
 
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin
 from loguru import logger
 
 from src.scraper.base_scraper import BaseScraper
+from src.utils.config import get_config
+
+# Numeric part of a price such as "£51.77"
+_PRICE_RE = re.compile(r'[\d.]+')
+
+# Turns product table headers such as "Price (excl. tax)" into keys like "price_excl_tax"
+_FIELD_KEY_TABLE = str.maketrans({' ': '_', '(': None, ')': None, '.': None})
 
 
 class BooksScraper(BaseScraper):
@@ -42,6 +50,16 @@ class BooksScraper(BaseScraper):
             'Five': 5
         }
 
+        # Product information table: field key -> parser for the cell text
+        self.field_parsers = {
+            'upc': str,
+            'product_type': str,
+            'price_excl_tax': self.extract_price,
+            'price_incl_tax': self.extract_price,
+            'tax': self.extract_price,
+            'number_of_reviews': lambda value: int(value) if value.isdigit() else 0
+        }
+
     def extract_price(self, price_text: str) -> float:
         """
         Extract numeric price from price text.
@@ -49,18 +67,21 @@ class BooksScraper(BaseScraper):
         @param {str} price_text - Price text (e.g., "£51.77")
         @returns {float} Numeric price value
         """
-        price_match = re.search(r'[\d.]+', price_text)
+        price_match = _PRICE_RE.search(price_text)
         return float(price_match.group()) if price_match else 0.0
 
     def extract_rating(self, rating_class: str) -> int:
         """
         Extract numeric rating from CSS class.
 
-        @param {str} rating_class - Rating CSS class
+        @param {list|str} rating_class - Rating CSS class tokens (e.g. ['star-rating', 'Three'])
         @returns {int} Numeric rating (1-5)
         """
-        for word, rating in self.rating_map.items():
-            if word in rating_class:
+        if isinstance(rating_class, str):
+            rating_class = rating_class.split()
+        for token in rating_class:
+            rating = self.rating_map.get(token)
+            if rating:
                 return rating
         return 0
 
@@ -99,12 +120,8 @@ class BooksScraper(BaseScraper):
             if image_container:
                 img = image_container.find('img')
                 if img and img.get('src'):
-                    img_src = img['src']
                     # Build full image URL
-                    if img_src.startswith('../../'):
-                        details['image_url'] = f"{self.base_url}{img_src.replace('../../', '')}"
-                    else:
-                        details['image_url'] = img_src
+                    details['image_url'] = urljoin(book_url, img['src'])
 
             # Extract UPC and other product information
             product_info_table = soup.find('table', class_='table table-striped')
@@ -114,23 +131,10 @@ class BooksScraper(BaseScraper):
                     header = row.find('th')
                     value = row.find('td')
                     if header and value:
-                        key = header.text.strip().lower().replace(' ', '_').replace('(', '').replace(')', '').replace(
-                            '.', '')
-                        value_text = value.text.strip()
-
-                        # Handle different field types
-                        if key == 'upc':
-                            details['upc'] = value_text
-                        elif key == 'product_type':
-                            details['product_type'] = value_text
-                        elif key == 'price_excl_tax':
-                            details['price_excl_tax'] = self.extract_price(value_text)
-                        elif key == 'price_incl_tax':
-                            details['price_incl_tax'] = self.extract_price(value_text)
-                        elif key == 'tax':
-                            details['tax'] = self.extract_price(value_text)
-                        elif key == 'number_of_reviews':
-                            details['number_of_reviews'] = int(value_text) if value_text.isdigit() else 0
+                        key = header.text.strip().lower().translate(_FIELD_KEY_TABLE)
+                        parser = self.field_parsers.get(key)
+                        if parser:
+                            details[key] = parser(value.text.strip())
 
             return details
 
@@ -138,6 +142,30 @@ class BooksScraper(BaseScraper):
             logger.error(f"Error scraping book details from {book_url}: {e}")
             return None
 
+    def _parse_book_card(self, book, page_url: str, category: str) -> Dict[str, Any]:
+        """
+        Extract the basic fields of one book card on a listing page.
+
+        @param {Tag} book - article.product_pod element
+        @param {str} page_url - URL of the listing page, used to resolve the book link
+        @param {str} category - Category to record for the book
+        @returns {dict} Book dictionary
+        """
+        title_elem = book.select_one('h3 > a')
+        book_url = title_elem.get('href', '')
+        price_elem = book.select_one('p.price_color')
+        availability_elem = book.select_one('p.instock.availability')
+        rating_elem = book.select_one('p.star-rating')
+
+        return {
+            'title': title_elem.get('title', ''),
+            'price': self.extract_price(price_elem.text) if price_elem else 0.0,
+            'availability': availability_elem.text.strip() if availability_elem else 'Unknown',
+            'rating': self.extract_rating(rating_elem.get('class', [])) if rating_elem else 0,
+            'url': urljoin(page_url, book_url) if book_url else '',
+            'category': category
+        }
+
     def scrape_page(self, page_url: str, include_details: bool = False) -> List[Dict[str, Any]]:
         """
         Scrape books from a single page.
@@ -150,79 +178,43 @@ class BooksScraper(BaseScraper):
         if not soup:
             return []
 
-        books = []
-        book_containers = soup.find_all('article', class_='product_pod')
+        return self._parse_listing_page(soup, page_url, include_details=include_details)
 
-        # Determine the base path based on current page URL
-        is_catalogue_page = 'catalogue' in page_url
+    def _parse_listing_page(self, soup, page_url: str, include_details: bool = False) -> List[Dict[str, Any]]:
+        """
+        Extract the books on an already fetched listing page.
 
-        for idx, book in enumerate(book_containers, 1):
-            try:
-                # Extract title
-                title_elem = book.find('h3').find('a')
-                title = title_elem.get('title', '')
-
-                # Extract price
-                price_elem = book.find('p', class_='price_color')
-                price = self.extract_price(price_elem.text) if price_elem else 0.0
-
-                # Extract availability
-                availability_elem = book.find('p', class_='instock availability')
-                availability = availability_elem.text.strip() if availability_elem else 'Unknown'
-
-                # Extract rating
-                rating_elem = book.find('p', class_='star-rating')
-                rating = self.extract_rating(rating_elem.get('class', [])) if rating_elem else 0
-
-                # Extract and construct proper URL
-                book_url = title_elem.get('href', '')
-                if book_url:
-                    # Handle different URL patterns
-                    if book_url.startswith('http'):
-                        # Already a full URL
-                        pass
-                    elif book_url.startswith('../../../'):
-                        # From main page: ../../../catalogue/book_id/index.html
-                        book_url = book_url.replace('../../../', '')
-                        book_url = f"{self.base_url}{book_url}"
-                    elif book_url.startswith('../'):
-                        # From catalogue pages: ../book_id/index.html
-                        book_url = book_url.replace('../', '')
-                        book_url = f"{self.base_url}catalogue/{book_url}"
-                    else:
-                        # Relative path without ../
-                        if not book_url.startswith('catalogue/'):
-                            book_url = f"catalogue/{book_url}"
-                        book_url = f"{self.base_url}{book_url}"
-
-                book_data = {
-                    'title': title,
-                    'price': price,
-                    'availability': availability,
-                    'rating': rating,
-                    'url': book_url,
-                    'category': 'Unknown'  # Default value
-                }
-
-                # Fetch detailed information if requested
-                if include_details and book_url:
-                    logger.info(f"Fetching details for book {idx}/{len(book_containers)}: {title[:50]}...")
-                    logger.debug(f"Book URL: {book_url}")
-                    details = self.scrape_book_details(book_url)
-                    if details:
-                        book_data.update(details)
-                    else:
-                        # If details fetch fails, still keep the basic data
-                        logger.warning(f"Could not fetch details for '{title[:50]}', using basic data only")
-                    time.sleep(0.5)  # Be nice to the server
+        @param {BeautifulSoup} soup - Parsed listing page
+        @param {str} page_url - URL of the listing page
+        @param {bool} include_details - Whether to fetch detailed info from each book's page
+        @returns {list} List of book dictionaries
+        """
+        books = []
 
+        for idx, book in enumerate(soup.select('article.product_pod'), 1):
+            try:
+                book_data = self._parse_book_card(book, page_url, 'Unknown')  # Default category
                 books.append(book_data)
-                logger.debug(f"Scraped book: {title}")
+                logger.opt(lazy=True).debug("Scraped book: {}", lambda: book_data['title'])
 
             except Exception as e:
                 logger.error(f"Error scraping book at index {idx}: {e}")
                 continue
 
+        # Fetch detailed information if requested; detail pages are independent,
+        # so up to max_workers of them are downloaded at once
+        if include_details:
+            detail_books = [book_data for book_data in books if book_data['url']]
+            logger.info(f"Fetching details for {len(detail_books)} books...")
+            with ThreadPoolExecutor(max_workers=get_config().max_workers) as executor:
+                all_details = executor.map(self.scrape_book_details, [b['url'] for b in detail_books])
+                for book_data, details in zip(detail_books, all_details):
+                    if details:
+                        book_data.update(details)
+                    else:
+                        # If details fetch fails, still keep the basic data
+                        logger.warning(f"Could not fetch details for '{book_data['title'][:50]}', using basic data only")
+
         return books
 
     def scrape_categories(self) -> List[Dict[str, str]]:
@@ -246,95 +238,112 @@ class BooksScraper(BaseScraper):
                 category_url = link.get('href', '')
 
                 if category_url:
-                    # Build full URL
-                    if category_url.startswith('../'):
-                        category_url = f"{self.base_url}{category_url.replace('../', '')}"
-
                     categories.append({
                         'name': category_name,
-                        'url': category_url
+                        'url': urljoin(self.base_url, category_url)
                     })
 
         logger.info(f"Found {len(categories)} categories")
         return categories
 
+    def _page_count(self, soup) -> int:
+        """
+        Read the number of pages from a listing's "Page X of Y" pager.
+
+        @param {BeautifulSoup} soup - Parsed listing page
+        @returns {int} Total number of pages (1 when there is no pager)
+        """
+        pager = soup.find('li', class_='current')
+        if pager:
+            last = pager.text.split()[-1]
+            if last.isdigit():
+                return int(last)
+        return 1
+
+    def _parse_category_page(self, soup, page_url: str, category_name: str) -> List[Dict[str, Any]]:
+        """
+        Extract the books listed on one page of a category.
+
+        @param {BeautifulSoup} soup - Parsed category page
+        @param {str} page_url - URL of the category page
+        @param {str} category_name - Name of the category
+        @returns {list} Books on the page
+        """
+        books = []
+
+        for book in soup.select('article.product_pod'):
+            try:
+                # Category comes from the current context
+                books.append(self._parse_book_card(book, page_url, category_name))
+
+            except Exception as e:
+                logger.error(f"Error scraping book in category {category_name}: {e}")
+                continue
+
+        return books
+
     def scrape_category(self, category_name: str, category_url: str, max_pages: Optional[int] = None) -> List[
         Dict[str, Any]]:
         """
         Scrape all books from a specific category.
 
+        The first page tells how many pages the category has; the
+        remaining pages are then fetched concurrently.
+
         @param {str} category_name - Name of the category
         @param {str} category_url - URL of the category
         @param {int|None} max_pages - Maximum pages to scrape for this category
         @returns {list} List of books in this category
         """
         logger.info(f"Scraping category: {category_name}")
-        all_books = []
-        page_num = 1
 
-        while True:
-            if max_pages and page_num > max_pages:
-                break
+        soup = self.fetch_page(category_url)
+        if not soup:
+            return []
 
-            # Construct page URL
-            if page_num == 1:
-                page_url = category_url
-            else:
-                # Replace index.html with page-X.html
-                page_url = category_url.replace('index.html', f'page-{page_num}.html')
+        all_books = self._parse_category_page(soup, category_url, category_name)
+        logger.info(f"  Page 1: Scraped {len(all_books)} books")
 
-            logger.info(f"  Scraping page {page_num}: {page_url}")
+        page_urls = self._category_page_urls(soup, category_url, max_pages)
+        with ThreadPoolExecutor(max_workers=get_config().max_workers) as executor:
+            return self._collect_category_pages(
+                category_name, all_books, page_urls, executor.map(self.fetch_page, page_urls)
+            )
 
-            soup = self.fetch_page(page_url)
-            if not soup:
-                break
-
-            book_containers = soup.find_all('article', class_='product_pod')
-            if not book_containers:
-                logger.info(f"  No books found on page {page_num}")
-                break
-
-            for book in book_containers:
-                try:
-                    # Extract title
-                    title_elem = book.find('h3').find('a')
-                    title = title_elem.get('title', '')
-
-                    # Extract price
-                    price_elem = book.find('p', class_='price_color')
-                    price = self.extract_price(price_elem.text) if price_elem else 0.0
-
-                    # Extract availability
-                    availability_elem = book.find('p', class_='instock availability')
-                    availability = availability_elem.text.strip() if availability_elem else 'Unknown'
-
-                    # Extract rating
-                    rating_elem = book.find('p', class_='star-rating')
-                    rating = self.extract_rating(rating_elem.get('class', [])) if rating_elem else 0
-
-                    # Extract URL
-                    book_url = title_elem.get('href', '')
-                    if book_url:
-                        if book_url.startswith('../'):
-                            book_url = f"{self.base_url}catalogue/{book_url.replace('../../../', '').replace('../', '')}"
-
-                    book_data = {
-                        'title': title,
-                        'price': price,
-                        'availability': availability,
-                        'rating': rating,
-                        'url': book_url,
-                        'category': category_name  # Set category from current context
-                    }
-
-                    all_books.append(book_data)
-
-                except Exception as e:
-                    logger.error(f"Error scraping book in category {category_name}: {e}")
-                    continue
-
-            logger.info(f"  Page {page_num}: Scraped {len(book_containers)} books")
-            page_num += 1
+    def _category_page_urls(self, soup, category_url: str, max_pages: Optional[int]) -> List[str]:
+        """
+        List the URLs of a category's pages after the first.
+
+        @param {BeautifulSoup} soup - Parsed first page of the category
+        @param {str} category_url - URL of the category
+        @param {int|None} max_pages - Maximum pages to scrape for this category
+        @returns {list} URLs of pages 2 and onwards
+        """
+        page_count = self._page_count(soup)
+        if max_pages:
+            page_count = min(page_count, max_pages)
+
+        # Replace index.html with page-X.html
+        return [category_url.replace('index.html', f'page-{page_num}.html') for page_num in range(2, page_count + 1)]
+
+    def _collect_category_pages(self, category_name: str, all_books: List[Dict[str, Any]], page_urls: List[str],
+                                page_soups) -> List[Dict[str, Any]]:
+        """
+        Add the books from a category's remaining pages to those of its first page.
+
+        @param {str} category_name - Name of the category
+        @param {list} all_books - Books from the first page, extended in place
+        @param {list} page_urls - URLs of pages 2 and onwards
+        @param {Iterable} page_soups - Parsed pages (or None) in the same order as page_urls
+        @returns {list} List of books in this category
+        """
+        for page_num, (page_url, page_soup) in enumerate(zip(page_urls, page_soups), 2):
+            if not page_soup:
+                logger.warning(f"  Could not fetch page {page_num} of {category_name}")
+                continue
+            books = self._parse_category_page(page_soup, page_url, category_name)
+            logger.info(f"  Page {page_num}: Scraped {len(books)} books")
+            all_books.extend(books)
 
         logger.info(f"Category '{category_name}': Total {len(all_books)} books")
         return all_books
@@ -355,38 +364,61 @@ class BooksScraper(BaseScraper):
             categories = self.scrape_categories()
             all_books = []
 
-            for category in categories:
-                books = self.scrape_category(
-                    category['name'],
-                    category['url'],
-                    max_pages=1 if max_pages else None  # Limit pages per category
-                )
-                all_books.extend(books)
-                time.sleep(1)  # Be nice to the server
+            # One pool serves every category: all first pages are fetched at once,
+            # then every category's remaining pages are queued behind them
+            with ThreadPoolExecutor(max_workers=get_config().max_workers) as executor:
+                first_pages = executor.map(self.fetch_page, [category['url'] for category in categories])
+                crawls = []
+                for category, soup in zip(categories, first_pages):
+                    logger.info(f"Scraping category: {category['name']}")
+                    if not soup:
+                        continue
+
+                    books = self._parse_category_page(soup, category['url'], category['name'])
+                    logger.info(f"  Page 1: Scraped {len(books)} books")
+                    page_urls = self._category_page_urls(
+                        soup,
+                        category['url'],
+                        max_pages=1 if max_pages else None  # Limit pages per category
+                    )
+                    crawls.append((category['name'], books, page_urls,
+                                   [executor.submit(self.fetch_page, page_url) for page_url in page_urls]))
+
+                for category_name, books, page_urls, futures in crawls:
+                    all_books.extend(self._collect_category_pages(
+                        category_name, books, page_urls, (future.result() for future in futures)
+                    ))
 
             logger.info(f"Total books scraped across all categories: {len(all_books)}")
             return all_books
 
         else:
-            # Original scraping method
-            all_books = []
-            page_num = 1
+            # Original scraping method; the first page tells how many pages
+            # there are, the remaining pages are then fetched concurrently
+            logger.info(f"Scraping page 1: {self.base_url}")
+            soup = self.fetch_page(self.base_url)
+            if not soup:
+                logger.info("No books found on page 1. Stopping.")
+                return []
 
-            while True:
-                if max_pages and page_num > max_pages:
-                    break
+            all_books = self._parse_listing_page(soup, self.base_url, include_details=include_details)
+            logger.info(f"Page 1: Scraped {len(all_books)} books (Total: {len(all_books)})")
 
-                page_url = f"{self.base_url}catalogue/page-{page_num}.html" if page_num > 1 else self.base_url
-                logger.info(f"Scraping page {page_num}: {page_url}")
+            page_count = self._page_count(soup)
+            if max_pages:
+                page_count = min(page_count, max_pages)
 
-                books = self.scrape_page(page_url, include_details=include_details)
-                if not books:
-                    logger.info(f"No books found on page {page_num}. Stopping.")
-                    break
+            page_urls = [urljoin(self.base_url, f"catalogue/page-{page_num}.html") for page_num in range(2, page_count + 1)]
 
-                all_books.extend(books)
-                logger.info(f"Page {page_num}: Scraped {len(books)} books (Total: {len(all_books)})")
-                page_num += 1
+            with ThreadPoolExecutor(max_workers=get_config().max_workers) as executor:
+                page_soups = executor.map(self.fetch_page, page_urls)
+                for page_num, (page_url, page_soup) in enumerate(zip(page_urls, page_soups), 2):
+                    if not page_soup:
+                        logger.warning(f"Could not fetch page {page_num}: {page_url}")
+                        continue
+                    books = self._parse_listing_page(page_soup, page_url, include_details=include_details)
+                    all_books.extend(books)
+                    logger.info(f"Page {page_num}: Scraped {len(books)} books (Total: {len(all_books)})")
 
             logger.info(f"Total books scraped: {len(all_books)}")
-            return all_books
\ No newline at end of file
+            return all_books
@@ -10,68 +10,95 @@ from environment variables and config files.
 """
 
 import os
+import functools
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
 
-# Load environment variables
-load_dotenv()
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
+@dataclass(frozen=True)
 class Config:
     """
     Configuration class for managing application settings.
 
     This class provides a centralized way to access configuration
-    parameters throughout the application.
+    parameters throughout the application. Use get_config() rather
+    than building it directly.
 
     @class Config
     """
 
     # Database Configuration
-    DB_HOST: str = os.getenv("DB_HOST", "localhost")
-    DB_PORT: int = int(os.getenv("DB_PORT", "5432"))
-    DB_NAME: str = os.getenv("DB_NAME", "data_pipeline")
-    DB_USER: str = os.getenv("DB_USER", "postgres")
-    DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
+    db_host: str
+    db_port: int
+    db_name: str
+    db_user: str
+    db_password: str
 
     # API Configuration
-    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    api_host: str
+    api_port: int
 
     # Scraping Configuration
-    TARGET_URL: str = os.getenv("TARGET_URL", "https://books.toscrape.com/")
-    REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    target_url: str
+    request_timeout: int
+    max_retries: int
+    max_workers: int
+    requests_per_second: float
 
     # Dashboard Configuration
-    DASHBOARD_PORT: int = int(os.getenv("DASHBOARD_PORT", "8501"))
+    dashboard_port: int
 
     # Project Paths
-    BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
-    DATA_DIR: Path = BASE_DIR / "data"
-    LOGS_DIR: Path = BASE_DIR / "logs"
+    base_dir: Path = _BASE_DIR
+    data_dir: Path = _BASE_DIR / "data"
+    logs_dir: Path = _BASE_DIR / "logs"
 
-    @classmethod
-    def get_database_url(cls) -> str:
+    def get_database_url(self) -> str:
         """
         Construct and return the database connection URL.
 
         @returns {str} PostgreSQL connection URL
         """
-        return f"postgresql://{cls.DB_USER}:{cls.DB_PASSWORD}@{cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}"
+        return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
-    @classmethod
-    def setup_directories(cls) -> None:
+    def setup_directories(self) -> None:
         """
         Create necessary directories if they don't exist.
 
         @returns {None}
         """
-        cls.DATA_DIR.mkdir(exist_ok=True)
-        cls.LOGS_DIR.mkdir(exist_ok=True)
+        self.data_dir.mkdir(exist_ok=True)
+        self.logs_dir.mkdir(exist_ok=True)
         logger.info("Directories setup complete")
 
 
-# Initialize directories on import
-Config.setup_directories()
\ No newline at end of file
+@functools.cache
+def get_config() -> Config:
+    """
+    Load the configuration from the environment on first use.
+
+    The .env file and environment variables are read once; later calls
+    return the same Config instance.
+
+    @returns {Config} Application configuration
+    """
+    load_dotenv()
+    return Config(
+        db_host=os.getenv("DB_HOST", "localhost"),
+        db_port=int(os.getenv("DB_PORT", "5432")),
+        db_name=os.getenv("DB_NAME", "data_pipeline"),
+        db_user=os.getenv("DB_USER", "postgres"),
+        db_password=os.getenv("DB_PASSWORD", ""),
+        api_host=os.getenv("API_HOST", "0.0.0.0"),
+        api_port=int(os.getenv("API_PORT", "8000")),
+        target_url=os.getenv("TARGET_URL", "https://books.toscrape.com/"),
+        request_timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
+        max_retries=int(os.getenv("MAX_RETRIES", "3")),
+        max_workers=int(os.getenv("MAX_WORKERS", "10")),
+        requests_per_second=float(os.getenv("REQUESTS_PER_SECOND", "10")),
+        dashboard_port=int(os.getenv("DASHBOARD_PORT", "8501"))
+    )
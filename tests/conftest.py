@@ -0,0 +1,28 @@
+"""
+Shared pytest setup.
+
+@module conftest
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path so `pytest tests/` can import src
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope="session")
+def dashboard_app():
+    """
+    Import the dashboard module without starting Streamlit.
+
+    @returns {module} dashboard/app.py
+    """
+    spec = importlib.util.spec_from_file_location("dashboard_app", project_root / "dashboard" / "app.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
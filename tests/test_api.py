@@ -0,0 +1,68 @@
+"""
+Tests for the REST API's keyset pagination.
+
+@module test_api
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes import app
+from src.database.connection import db_manager
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """
+    API client backed by a temporary SQLite database holding 23 books.
+
+    @yields {TestClient} Client with the startup event run
+    """
+    monkeypatch.setattr(db_manager, "database_url", f"sqlite:///{tmp_path / 'books.db'}")
+    monkeypatch.setattr(db_manager, "engine", None)
+    monkeypatch.setattr(db_manager, "SessionLocal", None)
+    with TestClient(app) as test_client:
+        db_manager.insert_books_bulk([
+            {'title': f'Book {i}', 'price': 10.0 + i, 'availability': 'In stock', 'rating': i % 5 + 1,
+             'category': 'Poetry', 'url': f'http://books.test/{i}', 'upc': f'UPC{i}'}
+            for i in range(23)
+        ])
+        yield test_client
+    db_manager.engine.dispose()
+
+
+def _page_through(client: TestClient, **params) -> tuple:
+    """
+    Follow X-Next-After-Id from after_id=0 until the header is absent.
+
+    @returns {tuple} Ids in the order received and the number of pages
+    """
+    ids, pages, after_id = [], 0, 0
+    while True:
+        response = client.get("/books", params={**params, 'after_id': after_id})
+        assert response.status_code == 200
+        pages += 1
+        ids.extend(book['id'] for book in response.json())
+        next_after_id = response.headers.get('X-Next-After-Id')
+        if next_after_id is None:
+            return ids, pages
+        after_id = int(next_after_id)
+
+
+@pytest.mark.parametrize("limit, pages", [(5, 5), (23, 1), (1, 23), (50, 1)])
+def test_keyset_pages_cover_every_book_once(client, limit, pages):
+    ids, page_count = _page_through(client, limit=limit)
+    assert ids == sorted(set(ids))
+    assert len(ids) == 23
+    assert page_count == pages
+
+
+def test_keyset_pages_with_price_filter(client):
+    ids, page_count = _page_through(client, limit=4, min_price=15, max_price=26)
+    assert len(ids) == 12 and ids == sorted(set(ids))
+    assert page_count == 3
+
+
+def test_cursor_header_is_exposed_to_browsers(client):
+    response = client.get("/books", params={'after_id': 0, 'limit': 5}, headers={'Origin': 'http://example.com'})
+    assert 'X-Next-After-Id' in response.headers['Access-Control-Expose-Headers']
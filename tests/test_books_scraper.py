@@ -0,0 +1,75 @@
+"""
+Tests for the books scraper's fetching and crawling.
+
+@module test_books_scraper
+"""
+
+import dataclasses
+
+import pytest
+import requests
+
+from src.scraper import base_scraper
+from src.scraper.books_scraper import BooksScraper
+from src.utils.config import get_config
+
+_BASE_URL = "http://books.test/"
+
+_LISTING = """
+<html><body>
+<article class="product_pod">
+  <p class="star-rating Three"></p>
+  <h3><a href="catalogue/book_1/index.html" title="{title}">{title}</a></h3>
+  <p class="price_color">£{price}</p>
+  <p class="instock availability">In stock</p>
+</article>
+</body></html>
+"""
+
+
+def _response(url: str, body: str) -> requests.Response:
+    """
+    Build a 200 response carrying an HTML body.
+
+    @param {str} url - Requested URL
+    @param {str} body - HTML text
+    @returns {Response} Response object
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body.encode()
+    return response
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """
+    Books scraper whose HTTP cache lives in a temporary directory.
+
+    @yields {BooksScraper} Scraper for the fake site
+    """
+    config = dataclasses.replace(get_config(), data_dir=tmp_path)
+    monkeypatch.setattr(base_scraper, "get_config", lambda: config)
+    books_scraper = BooksScraper(base_url=_BASE_URL)
+    yield books_scraper
+    books_scraper.close()
+
+
+def test_second_scrape_sees_changed_pages(scraper, monkeypatch):
+    pages = {_BASE_URL: _LISTING.format(title="First edition", price="10.00")}
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return _response(url, pages[url])
+
+    monkeypatch.setattr(scraper.session, "get", fake_get)
+
+    first = scraper.scrape()
+    pages[_BASE_URL] = _LISTING.format(title="Second edition", price="12.50")
+    second = scraper.scrape()
+
+    assert [book['title'] for book in first] == ["First edition"]
+    assert [(book['title'], book['price']) for book in second] == [("Second edition", 12.5)]
+    assert requested == [_BASE_URL, _BASE_URL]
@@ -0,0 +1,117 @@
+"""
+Tests for the bulk insert paths of the database manager.
+
+SQLite runs everywhere. The PostgreSQL COPY path runs when
+TEST_POSTGRES_URL points at a disposable database, whose books table
+is dropped and recreated.
+
+@module test_connection
+"""
+
+import os
+
+import pytest
+from sqlalchemy import select
+
+from src.database.connection import DatabaseManager
+from src.database.models import Book
+
+
+def _book(title: str, upc=None) -> dict:
+    """
+    Build a minimal scraped book.
+
+    @param {str} title - Book title
+    @param {str|None} upc - Universal Product Code
+    @returns {dict} Book dictionary
+    """
+    return {'title': title, 'price': 10.0, 'availability': 'In stock', 'rating': 3,
+            'category': 'Poetry', 'url': f'http://books.test/{title}', 'upc': upc}
+
+
+def _stored(manager: DatabaseManager) -> list:
+    """
+    Read back the stored books in id order.
+
+    @param {DatabaseManager} manager - Initialized manager
+    @returns {list} (id, title, upc, scraped_at) rows
+    """
+    with manager.get_session() as session:
+        return session.execute(
+            select(Book.id, Book.title, Book.upc, Book.scraped_at).order_by(Book.id)
+        ).all()
+
+
+def _manager(database_url: str) -> DatabaseManager:
+    """
+    Create a manager with a fresh books table.
+
+    @param {str} database_url - SQLAlchemy database URL
+    @returns {DatabaseManager} Initialized manager
+    """
+    manager = DatabaseManager()
+    manager.database_url = database_url
+    manager.initialize()
+    manager.drop_tables()
+    manager.create_tables()
+    return manager
+
+
+@pytest.fixture
+def sqlite_manager(tmp_path):
+    manager = _manager(f"sqlite:///{tmp_path / 'books.db'}")
+    yield manager
+    manager.engine.dispose()
+
+
+@pytest.fixture
+def postgres_manager():
+    url = os.environ.get('TEST_POSTGRES_URL')
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    manager = _manager(url)
+    yield manager
+    manager.drop_tables()
+    manager.engine.dispose()
+
+
+@pytest.fixture(params=['sqlite', 'postgres'])
+def manager(request):
+    return request.getfixturevalue(f"{request.param}_manager")
+
+
+def _check_skips_duplicates(insert, manager):
+    batch = [_book('first', 'A'), _book('second', 'B'), _book('repeat of first', 'A'), _book('no upc')]
+    assert insert(batch) == 3
+    assert insert([_book('stored again', 'A'), _book('third', 'C'), _book('also no upc')]) == 2
+
+    rows = _stored(manager)
+    assert [(title, upc) for _, title, upc, _ in rows] == [
+        ('first', 'A'), ('second', 'B'), ('no upc', None), ('third', 'C'), ('also no upc', None)
+    ]
+    assert all(scraped_at is not None for *_, scraped_at in rows)
+    return rows
+
+
+def test_insert_books_bulk_skips_duplicates(manager):
+    _check_skips_duplicates(manager.insert_books_bulk, manager)
+
+
+def test_insert_books_core_skips_duplicates(manager):
+    _check_skips_duplicates(manager._insert_books_core, manager)
+
+
+def test_insert_books_copy_keeps_ids_dense(postgres_manager):
+    rows = _check_skips_duplicates(postgres_manager.insert_books_copy, postgres_manager)
+    assert [book_id for book_id, *_ in rows] == [1, 2, 3, 4, 5]
+
+
+def test_insert_books_copy_requires_postgres(sqlite_manager):
+    with pytest.raises(ValueError):
+        sqlite_manager.insert_books_copy([_book('first', 'A')])
+
+
+def test_bulk_insert_refreshes_statistics(sqlite_manager):
+    assert sqlite_manager.get_statistics()['total_books'] == 0
+    sqlite_manager.insert_books_bulk([_book('first', 'A')])
+    assert sqlite_manager.get_statistics()['total_books'] == 1
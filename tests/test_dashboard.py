@@ -0,0 +1,73 @@
+"""
+Tests for the dashboard's data preparation helpers.
+
+@module test_dashboard
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+
+@pytest.mark.parametrize("text, in_stock, quantity", [
+    ("In stock (22 available)", True, 22.0),
+    ("22 available / In stock", True, 22.0),
+    ("in stock", True, None),
+    ("Out of stock", False, None),
+    (None, False, None),
+])
+def test_parse_availability(dashboard_app, text, in_stock, quantity):
+    status, stock_quantity = dashboard_app._parse_availability(pa.chunked_array([[text]], pa.string()))
+    assert status.to_pylist() == [in_stock]
+    assert stock_quantity.to_pylist() == [quantity]
+
+
+def _numeric_frame(rng, rows=200):
+    """
+    Build correlated numeric columns like the dashboard's book data.
+
+    @param {Generator} rng - Random number generator
+    @param {int} rows - Number of rows
+    @returns {DataFrame} Frame with price, rating and stock columns
+    """
+    price = rng.uniform(10, 60, rows)
+    return pd.DataFrame({
+        'price': price,
+        'rating': np.round(price / 12 + rng.normal(0, 1, rows)),
+        'stock_quantity': rng.integers(0, 25, rows).astype(float),
+    })
+
+
+def test_correlation_matrix_matches_pandas(dashboard_app):
+    frame = _numeric_frame(np.random.default_rng(0))
+    result = dashboard_app._correlation_matrix(frame.to_numpy())
+    np.testing.assert_allclose(result, frame.corr().to_numpy(), atol=1e-5)
+
+
+def test_correlation_matrix_uses_pairwise_complete_rows(dashboard_app):
+    rng = np.random.default_rng(1)
+    frame = _numeric_frame(rng)
+    frame.loc[rng.choice(len(frame), 40, replace=False), 'rating'] = np.nan
+    frame.loc[rng.choice(len(frame), 25, replace=False), 'stock_quantity'] = np.nan
+
+    result = dashboard_app._correlation_matrix(frame.to_numpy())
+    np.testing.assert_allclose(result, frame.corr().to_numpy(), atol=1e-5)
+
+
+@pytest.mark.parametrize("n, n_out", [(1000, 50), (101, 3), (10, 9)])
+def test_lttb_indices_shape(dashboard_app, n, n_out):
+    rng = np.random.default_rng(2)
+    x = np.sort(rng.uniform(0, 100, n))
+    y = rng.normal(0, 1, n)
+
+    kept = dashboard_app._lttb_indices(x, y, n_out)
+
+    assert len(kept) == n_out
+    assert kept[0] == 0 and kept[-1] == n - 1
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_lttb_indices_keeps_everything_when_small(dashboard_app):
+    x = np.arange(5, dtype=float)
+    np.testing.assert_array_equal(dashboard_app._lttb_indices(x, x, 10), np.arange(5))
@@ -0,0 +1,72 @@
+"""
+Tests for the scraper's token-bucket rate limiter.
+
+@module test_rate_limiter
+"""
+
+import pytest
+
+from src.scraper.base_scraper import RateLimiter
+
+
+class FakeClock:
+    """
+    Manual clock whose sleep advances time instantly.
+
+    @class FakeClock
+    """
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _start_times(limiter: RateLimiter, clock: FakeClock, requests: int) -> list:
+    """
+    Acquire the limiter repeatedly and record when each request may start.
+
+    @returns {list} Clock readings after each acquire
+    """
+    starts = []
+    for _ in range(requests):
+        limiter.acquire()
+        starts.append(clock.now - 100.0)
+    return starts
+
+
+def test_bursts_up_to_rate_then_paces():
+    clock = FakeClock()
+    limiter = RateLimiter(4, clock=clock, sleep=clock.sleep)
+
+    starts = _start_times(limiter, clock, 8)
+
+    assert starts[:4] == [0.0] * 4
+    assert starts[4:] == pytest.approx([0.25, 0.5, 0.75, 1.0])
+
+
+def test_idle_time_refills_only_up_to_capacity():
+    clock = FakeClock()
+    limiter = RateLimiter(2, clock=clock, sleep=clock.sleep)
+    _start_times(limiter, clock, 2)
+
+    clock.now += 60
+    clock.sleeps.clear()
+    _start_times(limiter, clock, 3)
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_zero_rate_never_waits():
+    clock = FakeClock()
+    limiter = RateLimiter(0, clock=clock, sleep=clock.sleep)
+
+    _start_times(limiter, clock, 50)
+
+    assert clock.sleeps == []